@@ -80,17 +80,85 @@ class AssetManager:
             self.logger.error(f"❌ Ingestion failed: {e}")
             return False
 
+    def ingest_assets_batch(self, assets: List[str], project_path: str) -> Dict[str, Dict[str, str]]:
+        """
+        Ingest several assets in one pass: a single library scan resolves every
+        query, and project_assets.json is read and written once for the batch.
+        Entries may be asset names (library queries) or paths to existing files.
+        Returns a per-asset status dict keyed by the requested entry.
+        """
+        results: Dict[str, Dict[str, str]] = {}
+        pending: List[str] = []
+        resolved: Dict[str, Path] = {}
+        for entry in assets:
+            path = Path(entry)
+            if path.is_file():
+                resolved[entry] = path
+            else:
+                pending.append(entry)
+
+        if pending:
+            queries = {entry: entry.lower() for entry in pending}
+            for file in self.library_path.rglob("*"):
+                name = file.name.lower()
+                matched = [entry for entry, q in queries.items() if q in name]
+                if matched and file.is_file():
+                    for entry in matched:
+                        resolved[entry] = file
+                        del queries[entry]
+                    if not queries:
+                        break
+            for entry in queries:
+                self.logger.warning(f"⚠️ No local asset matches: {entry}")
+                results[entry] = {"status": "failed", "error": "Asset not found in local library"}
+
+        dest_folder = Path(project_path) / "Raw_Downloads"
+        dest_folder.mkdir(parents=True, exist_ok=True)
+        manifest_path = Path(project_path) / "project_assets.json"
+        manifest = self._load_manifest(manifest_path)
+        registered = 0
+
+        for entry, source in resolved.items():
+            dest_path = dest_folder / source.name
+            try:
+                if not dest_path.exists():
+                    shutil.copy2(source, dest_path)
+                asset_id = self._add_manifest_entry(
+                    manifest, source.stem, self._determine_asset_type(source.suffix), f"Raw_Downloads/{source.name}"
+                )
+                registered += 1
+                results[entry] = {"status": "success", "asset_id": asset_id, "path": str(dest_path)}
+            except Exception as e:
+                self.logger.error(f"❌ Ingestion failed for {entry}: {e}")
+                results[entry] = {"status": "failed", "error": str(e)}
+
+        if registered:
+            self._write_manifest(manifest_path, manifest)
+            self.logger.info(f"📁 Manifest Updated: Registered {registered} assets")
+        # Report in request order
+        return {entry: results[entry] for entry in assets}
+
     def _register_in_manifest(self, project_path: str, name: str, asset_type: str, rel_path: str):
         """Updates project_assets.json with the new asset and description."""
         manifest_path = Path(project_path) / "project_assets.json"
-        
+        manifest = self._load_manifest(manifest_path)
+        asset_id = self._add_manifest_entry(manifest, name, asset_type, rel_path)
+        self._write_manifest(manifest_path, manifest)
+        self.logger.info(f"📁 Manifest Updated: Registered {asset_id}")
+
+    def _load_manifest(self, manifest_path: Path) -> Dict:
         # Load existing manifest or create new
         if manifest_path.exists():
             with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
-        else:
-            manifest = {"assets": [], "last_asset_id": 0}
+                return json.load(f)
+        return {"assets": [], "last_asset_id": 0}
+
+    def _write_manifest(self, manifest_path: Path, manifest: Dict) -> None:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
 
+    def _add_manifest_entry(self, manifest: Dict, name: str, asset_type: str, rel_path: str) -> str:
+        """Append one asset record to a loaded manifest and return its id."""
         new_id_num = manifest["last_asset_id"] + 1
         asset_id = f"{asset_type.upper()}_{str(new_id_num).zfill(3)}"
         
@@ -105,11 +173,8 @@ class AssetManager:
 
         manifest["assets"].append(new_entry)
         manifest["last_asset_id"] = new_id_num
-        manifest["last_updated"] = datetime.now().isoformat()
-
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-        self.logger.info(f"📁 Manifest Updated: Registered {asset_id}")
+        manifest["last_updated"] = new_entry["timestamp"]
+        return asset_id
 
     def _determine_asset_type(self, suffix: str) -> str:
         suffix = suffix.lower()
@@ -2,35 +2,144 @@
 VrindaAI - Unified Orchestrator (AAA Pipeline + Neural Link Version)
 """
 
+import asyncio
+import copy
 import json
+import re
+import hashlib
+import importlib
+import itertools
 import logging
+import shutil
+import string
 import time
 import sys
 import os
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Callable, Iterator, Set, Tuple, TypedDict
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime
 
 # --- SYSTEM PATH FIX ---
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 # --- NEURAL LINK IMPORTS ---
-import grpc
 try:
+    import grpc
     from src.core.proto import vryndara_pb2, vryndara_pb2_grpc
 except ImportError:
+    grpc = None
     vryndara_pb2 = None
     vryndara_pb2_grpc = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+    def _write_json(path: Path, obj: Any) -> None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, default=str, sort_keys=sort_keys)
+
+    def _write_json(path: Path, obj: Any) -> None:
+        path.write_text(json.dumps(obj, indent=2))
+
 # Import Engines & Managers
-from src.engines.ffmpeg_engine import create_ffmpeg_engine
+# Engine modules are imported on first use (see _lazy_factory): status checks,
+# project init and Kernel offloads never pay for them.
 from src.core.asset_manager import create_asset_manager, AssetManager 
-from src.engines.unreal_engine import create_unreal_engine, UnrealEngine 
-from src.engines.blender_engine import create_blender_engine
+if TYPE_CHECKING:
+    from src.engines.unreal_engine import UnrealEngine
+
+def _lazy_factory(module: str, name: str) -> Callable[[], Any]:
+    """Engine factory that imports its module on first call."""
+    def factory():
+        return getattr(importlib.import_module(module), name)()
+    factory.__name__ = name
+    return factory
 
 logger = logging.getLogger(__name__)
 
+# Constant parts of the job manifests, keyed by (engine, job type); generators
+# only add the per-workflow fields.
+_MANIFEST_SKELETONS: Dict[tuple, MappingProxyType] = {
+    ("blender", "render"): MappingProxyType({"id": "blender_render", "engine": "blender", "type": "render"}),
+    ("blender", "render_sequence"): MappingProxyType({"id": "blender_render_sequence", "engine": "blender", "type": "render_sequence"}),
+    ("unreal", "project_create"): MappingProxyType({"id": "1_create_project", "engine": "unreal", "type": "project_create"}),
+    ("unreal", "ingest_batch"): MappingProxyType({"id": "2_ingest_assets", "engine": "unreal", "type": "ingest_batch"}),
+}
+
+
+def _file_digests(paths: List[Path]) -> Dict[str, str]:
+    """sha256 of each file's bytes, keyed by name; OSError if one is missing."""
+    return {path.name: hashlib.sha256(path.read_bytes()).hexdigest() for path in paths}
+
+
+def _skeleton_manifest(engine: str, job_type: str, **fields) -> Dict[str, Any]:
+    """Fresh manifest dict from the shared skeleton plus per-job fields."""
+    return {**_MANIFEST_SKELETONS[(engine, job_type)], **fields}
+
+# Descriptions that name engineering work go to the Kernel. Matches the word stem
+# ("design", "designs", "designed") case-insensitively without lowering the text.
+_OFFLOAD_RE = re.compile(r"\bdesign", re.IGNORECASE)
+
+# The status_check reply never changes; serialize it once
+_STATUS_JSON = _dumps({"status": "online", "engines": ["unreal", "blender", "cad"]})
+
+# Blender script written by init_project_content; only the per-project fields vary
+_GEOMETRY_SCRIPT_TEMPLATE = string.Template("""
+import bpy
+# Auto-generated by VrindaAI for project: $project_name
+# Prompt: $prompt
+
+def create_scene():
+    # Clear existing
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    
+    # Create Base Geometry (Cube Placeholder for now, AI logic goes here)
+    bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 1))
+    cube = bpy.context.active_object
+    cube.name = "${project_name}_Base"
+    
+    # Save
+    bpy.ops.wm.save_as_mainfile(filepath="$blend_path")
+
+if __name__ == "__main__":
+    create_scene()
+""")
+
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "output_dir": "output",
+    "paths": {"vault_cache": "C:/Vault"},
+    "max_parallel_jobs": 1,
+    "max_gpu_jobs": 1,
+    "continue_on_error": False,
+    "retry_failed": True,
+    "max_retries": 2,
+    "retry_delay": 1.0,
+    "memoize_jobs": True,
+    "history_limit": 100
+}
+
 class WorkflowStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -39,84 +148,467 @@ class WorkflowStatus(Enum):
     CANCELLED = "cancelled"
     OFFLOADED = "offloaded"
 
+# Status strings as written into workflow results
+_ST_PENDING = WorkflowStatus.PENDING.value
+_ST_RUNNING = WorkflowStatus.RUNNING.value
+_ST_COMPLETED = WorkflowStatus.COMPLETED.value
+_ST_FAILED = WorkflowStatus.FAILED.value
+_ST_OFFLOADED = WorkflowStatus.OFFLOADED.value
+
 class ExecutionMode(Enum):
     SEQUENTIAL = "sequential"
     PARALLEL = "parallel"
     INTERACTIVE = "interactive"
 
+@dataclass(frozen=True)
+class WorkflowContext:
+    """Per-workflow names and paths, derived once in execute_workflow and passed to every generator."""
+    workflow_id: str
+    safe_desc: str
+    run_dir: Path
+    project_path: Path
+
+class DependencyIndex(TypedDict):
+    """Job DAG over manifest positions, built by Orchestrator._index_dependencies."""
+    children: List[List[int]]  # children[i]: indices of the jobs job i unblocks
+    remaining: List[int]       # remaining[i]: number of dependencies job i waits on
+
+# Persistent job pools shared by every Orchestrator, keyed by pool name and worker
+# count, so parallel workflows reuse warm threads instead of spawning a pool per run.
+_JOB_POOLS: Dict[Tuple[str, int], ThreadPoolExecutor] = {}
+_JOB_POOLS_LOCK = threading.Lock()
+
+# Job types that saturate the GPU; they get their own small pool so concurrent
+# renders cannot oversubscribe the device while ingests keep running
+_GPU_JOB_TYPES = frozenset({"render", "render_sequence"})
+
+def _get_job_pool(max_workers: int, name: str = "job") -> ThreadPoolExecutor:
+    with _JOB_POOLS_LOCK:
+        key = (name, max_workers)
+        pool = _JOB_POOLS.get(key)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"vrinda-{name}")
+            _JOB_POOLS[key] = pool
+        return pool
+
+def _shutdown_job_pools() -> None:
+    with _JOB_POOLS_LOCK:
+        for pool in _JOB_POOLS.values():
+            pool.shutdown(wait=True)
+        _JOB_POOLS.clear()
+
+atexit.register(_shutdown_job_pools)
+
+# Kernel link: one event loop thread and one HTTP/2 channel per address, shared by
+# every KernelClient so later Orchestrators skip the connection handshake.
+# The Kernel server must allow 30s keepalive pings without calls
+# (grpc.http2.min_ping_interval_without_data_ms), or it will answer with GOAWAY.
+_KERNEL_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+)
+_LINK_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_KERNEL_CHANNELS: Dict[str, Any] = {}
+# Readiness per address, probed once: with no Kernel deployed, offloads are
+# disabled up front instead of every design workflow waiting out a failed RPC
+_KERNEL_READY: Dict[str, bool] = {}
+_KERNEL_LINK_LOCK = threading.Lock()
+
+def _get_channel(address: str) -> Tuple[Any, asyncio.AbstractEventLoop]:
+    """Shared grpc.aio channel for address and the loop it belongs to."""
+    global _LINK_LOOP
+    with _KERNEL_LINK_LOCK:
+        if _LINK_LOOP is None:
+            _LINK_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LINK_LOOP.run_forever, name="vrinda-kernel-link", daemon=True).start()
+        channel = _KERNEL_CHANNELS.get(address)
+        if channel is None:
+            # aio channels belong to the loop that created them
+            async def open_channel():
+                return grpc.aio.insecure_channel(address, options=_KERNEL_CHANNEL_OPTIONS)
+            channel = asyncio.run_coroutine_threadsafe(open_channel(), _LINK_LOOP).result()
+            _KERNEL_CHANNELS[address] = channel
+        return channel, _LINK_LOOP
+
+def _kernel_ready(address: str, channel: Any, loop: asyncio.AbstractEventLoop, timeout: float) -> bool:
+    """Whether address accepted a connection within timeout seconds; probed once per process."""
+    with _KERNEL_LINK_LOCK:
+        ready = _KERNEL_READY.get(address)
+    if ready is not None:
+        return ready
+    async def wait_ready():
+        await asyncio.wait_for(channel.channel_ready(), timeout)
+    try:
+        asyncio.run_coroutine_threadsafe(wait_ready(), loop).result()
+        ready = True
+    except Exception:
+        ready = False
+    with _KERNEL_LINK_LOCK:
+        _KERNEL_READY[address] = ready
+    return ready
+
+def _close_channels() -> None:
+    with _KERNEL_LINK_LOCK:
+        if _LINK_LOOP is None:
+            return
+        async def close_all():
+            for channel in _KERNEL_CHANNELS.values():
+                await channel.close()
+        try:
+            asyncio.run_coroutine_threadsafe(close_all(), _LINK_LOOP).result(timeout=5)
+        finally:
+            _KERNEL_CHANNELS.clear()
+            _LINK_LOOP.call_soon_threadsafe(_LINK_LOOP.stop)
+
+atexit.register(_close_channels)
+
+# Workflow ids: 6 random hex chars fixed per process, then a counter (8 chars for
+# the first 256 workflows, growing only as needed)
+_WORKFLOW_ID_PREFIX = os.urandom(3).hex()
+_WORKFLOW_ID_COUNTER = itertools.count()
+
+# Jobs whose output path is a directory the job fills (created by _ensure_layout)
+_DIRECTORY_OUTPUTS = frozenset({("blender", "render"), ("blender", "render_sequence")})
+
+# (engine, job type) pairs whose output is a pure function of the manifest and its
+# input files, so a previous result can be copied into a new run directory.
+_MEMOIZABLE_JOBS = frozenset({("blender", "render")})
+
+def _normalize_engine(engine: Any) -> Any:
+    """Map EngineType members and loosely-cased names onto the canonical engine key."""
+    if isinstance(engine, Enum):
+        engine = engine.value
+    return engine.strip().lower() if isinstance(engine, str) else engine
+
+class _SafeDescTable(dict):
+    """
+    str.translate table for folder names: keeps alphanumerics, space, '-' and
+    '_', deletes everything else. Populated lazily so non-ASCII letters keep
+    their isalnum() semantics without precomputing the whole code space.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        ch = chr(codepoint)
+        keep = codepoint if ch.isalnum() or ch in " -_" else None
+        self[codepoint] = keep
+        return keep
+
+
+_SAFE_DESC_TABLE = _SafeDescTable()
+
+
+def _safe_desc(desc: str) -> str:
+    """Folder-safe, 30-char prefix of a description."""
+    if len(desc) <= 256:
+        return _safe_desc_cached(desc)
+    # Long prompts: sanitize growing prefixes, so the cost is bounded by what the
+    # 30-char result needs rather than by the prompt length (and the cache never
+    # pins multi-megabyte keys)
+    window = 256
+    while window < len(desc):
+        safe = desc[:window].translate(_SAFE_DESC_TABLE).lstrip()
+        # Settled once a kept non-space char lies past the cut: strip() on the
+        # full text could no longer change the first 30 chars
+        if len(safe) > 30 and not safe[30:].isspace():
+            return safe[:30]
+        window *= 4
+    return desc.translate(_SAFE_DESC_TABLE).strip()[:30]
+
+
+@lru_cache(maxsize=1024)
+def _safe_desc_cached(desc: str) -> str:
+    # Cached across retries and reruns of the same prompt
+    return desc.translate(_SAFE_DESC_TABLE).strip()[:30]
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Local ISO-8601 timestamp (microsecond precision) for a time.time_ns() value."""
+    seconds, rem = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=rem // 1000).isoformat()
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """
+    Convert a result tree to plain JSON types (Enum -> value, Path -> str,
+    datetime -> ISO string) so encoders never fall back to a default hook.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {k if isinstance(k, str) else str(_to_jsonable(k)): _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return [_to_jsonable(v) for v in obj]
+    if isinstance(obj, Enum):
+        return _to_jsonable(obj.value)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _is_under(value: str, root: str) -> bool:
+    return value == root or value.startswith(root.rstrip("/\\") + os.sep)
+
+
+def _paths_under(obj: Any, root: str) -> Iterator[str]:
+    """Every string in a result (nested dicts/lists included) naming root or a path inside it."""
+    if isinstance(obj, str):
+        if _is_under(obj, root):
+            yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _paths_under(value, root)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _paths_under(value, root)
+
+
+def _rebase_paths(obj: Any, old_root: str, new_root: str) -> Any:
+    """Copy of a result with paths under old_root moved under new_root."""
+    if isinstance(obj, str):
+        return new_root + obj[len(old_root):] if _is_under(obj, old_root) else obj
+    if isinstance(obj, dict):
+        return {k: _rebase_paths(v, old_root, new_root) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rebase_paths(v, old_root, new_root) for v in obj]
+    return obj
+
+
+def _clone_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep copy of a job manifest. Manifests are JSON-shaped, so an orjson round
+    trip is far cheaper than copy.deepcopy; anything orjson rejects falls back.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(orjson.dumps(manifest))
+        except TypeError:
+            pass
+    return copy.deepcopy(manifest)
+
+
+def _parse_job_selection(answer: str, count: int) -> Set[int]:
+    """Parse "1,3-5" / "all" (1-based, inclusive ranges) into 0-based job indices."""
+    answer = answer.strip().lower()
+    if not answer or answer == "all":
+        return set(range(count))
+    selected: Set[int] = set()
+    for token in answer.split(","):
+        token = token.strip()
+        if token == "all":
+            return set(range(count))
+        start, sep, end = token.partition("-")
+        try:
+            first = int(start)
+            last = int(end) if sep else first
+        except ValueError:
+            logger.warning("Ignoring invalid job selection: %r", token)
+            continue
+        selected.update(i - 1 for i in range(first, last + 1) if 1 <= i <= count)
+    return selected
+
+
+class TransientEngineError(RuntimeError):
+    """Engine failure worth retrying (launch failure, locked file), unlike a bad manifest."""
+
+    def __init__(self, message: str, result: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        # The engine's failed result, reported as-is once retries run out
+        self.result = result
+
 class KernelClient:
     """The Neural Link: Handles communication with Vryndara."""
-    def __init__(self, address='localhost:50051'):
+    _Signal = vryndara_pb2.Signal if vryndara_pb2 is not None else None
+
+    def __init__(self, address='localhost:50051', timeout: float = 30.0, max_inflight: int = 4,
+                 connect_timeout: float = 2.0):
         self.logger = logging.getLogger("KernelLink")
         self.enabled = False
+        self.timeout = timeout
+        self.max_inflight = max(1, max_inflight)
+        self.channel = None
+        self.stub = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Created on the link loop by the first submission
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
         
         if vryndara_pb2 is None:
             self.logger.warning("⚠️ gRPC Protos not found. Neural Link disabled.")
             return
 
         try:
-            self.channel = grpc.insecure_channel(address)
+            # Shared channel and loop thread: synchronous callers overlap Kernel RPCs
+            # with local work, and repeat Orchestrators reuse the HTTP/2 connection.
+            self.channel, self._loop = _get_channel(address)
             self.stub = vryndara_pb2_grpc.KernelStub(self.channel)
+            # grpc.aio channels connect lazily, so creating one proves nothing
+            if not _kernel_ready(address, self.channel, self._loop, connect_timeout):
+                self.logger.warning("⚠️ Vryndara Kernel not reachable at %s. Neural Link disabled.", address)
+                return
             self.enabled = True
-            self.logger.info(f"🔗 Connected to Vryndara Kernel at {address}")
+            self.logger.info("🔗 Connected to Vryndara Kernel at %s", address)
         except Exception as e:
-            self.logger.error(f"❌ Failed to connect to Kernel: {e}")
+            self.logger.error("❌ Failed to connect to Kernel: %s", e)
+
+    async def submit_engineering_task(self, description: str, signal=None) -> Dict[str, Any]:
+        """
+        Publish an engineering task to the Kernel and return the artifacts it
+        acknowledges with (sent as JSON in Ack.error on success).
+        signal: optional Signal message to reuse; every field is overwritten.
+        """
+        if signal is None:
+            signal = self._Signal()
+        # One clock read yields both the task id and the Signal's epoch-seconds stamp
+        now = time.time_ns()
+        # Plain field assignment skips the keyword-argument constructor path
+        signal.id = f"task_{now:x}"
+        signal.source_agent_id = "VrindaAI-Client"
+        signal.target_agent_id = "ComputationalEngineer"
+        signal.type = "TASK_REQUEST"
+        signal.payload = description
+        signal.timestamp = now // 1_000_000_000
+        ack = await self.stub.Publish(signal, timeout=self.timeout)
+        if not ack.success:
+            raise RuntimeError(ack.error or "Kernel rejected the engineering task")
+        if not ack.error:
+            return {}
+        try:
+            artifacts = _loads(ack.error)
+        except ValueError:
+            return {"message": ack.error}
+        return artifacts if isinstance(artifacts, dict) else {"result": artifacts}
+
+    def submit_engineering_task_future(self, description: str) -> Future:
+        """Queue description for the offload workers; returns a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(self._enqueue(description), self._loop)
+
+    async def _enqueue(self, description: str) -> Dict[str, Any]:
+        # Bursts spill into the bounded queue; at most max_inflight Publish RPCs
+        # are on the channel at once
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=256)
+            self._workers = [asyncio.create_task(self._offload_worker()) for _ in range(self.max_inflight)]
+        result = asyncio.get_running_loop().create_future()
+        await self._queue.put((description, result))
+        return await result
+
+    async def _offload_worker(self) -> None:
+        # Each worker has one request in flight at a time, so it can reuse one message
+        signal = self._Signal()
+        while True:
+            description, result = await self._queue.get()
+            try:
+                artifacts = await self.submit_engineering_task(description, signal)
+                if not result.done():
+                    result.set_result(artifacts)
+            except asyncio.CancelledError:
+                if not result.done():
+                    result.cancel()
+                raise
+            except Exception as e:
+                if not result.done():
+                    result.set_exception(e)
+
+    def _stop_workers(self) -> None:
+        # Runs on the link loop. Queued requests are cancelled rather than left
+        # pending; the next submission starts a fresh queue and workers.
+        queue, self._queue = self._queue, None
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        while queue is not None and not queue.empty():
+            _, result = queue.get_nowait()
+            if not result.done():
+                result.cancel()
+
+    def close(self) -> None:
+        # The channel is shared per address and closed at interpreter exit
+        self.enabled = False
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stop_workers)
 
 class Orchestrator:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or self._load_default_config()
-        self.logger = logging.getLogger(__name__)
+        self._ensured_dirs: Set[Path] = set()
         
         self.output_dir = Path(self.config.get("output_dir", "output")).resolve()
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.output_dir)
         
         self.unreal_root = self.config.get("paths", {}).get("unreal_projects_root")
         if self.unreal_root:
             self.unreal_root = Path(self.unreal_root).resolve()
         else:
             self.unreal_root = self.output_dir / "games"
-        self.unreal_root.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.unreal_root)
 
         self.asset_manager: AssetManager = create_asset_manager(self.config)
         
         kernel_addr = self.config.get("kernel_address", "localhost:50051")
-        self.kernel = KernelClient(address=kernel_addr)
+        self.kernel = KernelClient(
+            address=kernel_addr,
+            timeout=self.config.get("kernel_timeout", 30.0),
+            connect_timeout=self.config.get("kernel_connect_timeout", 2.0),
+            max_inflight=self.config.get("max_parallel_jobs", 4)
+        )
         
         self.workflow_status = {}
-        self.execution_history = []
+        # Engine wrappers are built once (executable discovery, probes) and reused
+        self._engines: Dict[str, Any] = {}
+        # Permanent factory failures (engine not installed, import error) are remembered so
+        # every later job and retry fails fast instead of re-probing the install
+        self._engine_errors: Dict[str, Exception] = {}
+        self._engines_lock = threading.Lock()
+        # Reports are written off the critical path; close() waits for them
+        self._report_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vrinda-report")
+        self._pending_writes: Set[Future] = set()
+        # Bounded so a long-running orchestrator does not accumulate results forever
+        self.execution_history: deque = deque(maxlen=self.config.get("history_limit", 100))
     
     def _load_default_config(self) -> Dict[str, Any]:
-        return {
-            "output_dir": "output",
-            "paths": {"vault_cache": "C:/Vault"}, 
-            "max_parallel_jobs": 1,
-            "continue_on_error": False
-        }
+        # Deep copy: callers and engines may mutate the config (e.g. nested "paths")
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once per Orchestrator; later calls skip the syscalls."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _ensure_dirs(self, paths: Set[Path]) -> None:
+        """Create a batch of directories in one pass, skipping ones already made."""
+        todo = paths - self._ensured_dirs
+        # makedirs on the deepest paths creates their ancestors as well
+        covered = {parent for path in todo for parent in path.parents}
+        for path in todo - covered:
+            os.makedirs(path, exist_ok=True)
+        self._ensured_dirs |= todo
 
     # --- UNIVERSAL ROUTER (Entry Point) ---
     def process_request(self, request_json: str) -> str:
         try:
-            data = json.loads(request_json)
+            data = _loads(request_json)
             method = data.get("method")
             params = data.get("params", {})
 
-            self.logger.info(f"Universal Link received method: {method}")
-
-            if method == "init_project_content":
-                return self.init_project_content(params)
-            elif method == "create_project":
-                # If path is provided, use init logic, else use legacy
-                if "path" in params:
-                    return self.init_project_content(params)
-                return self.create_project(params.get("name"), params.get("prompt"), params.get("type", "game"))
-            elif method == "status_check":
-                return json.dumps({"status": "online", "engines": ["unreal", "blender", "cad"]})
-            else:
-                return json.dumps({"status": "error", "message": f"Unknown method: {method}"})
+            logger.info("Universal Link received method: %s", method)
+
+            handler = self._REQUEST_HANDLERS.get(method)
+            if handler is None:
+                return _dumps({"status": "error", "message": f"Unknown method: {method}"})
+            return handler(self, params)
 
         except Exception as e:
-            self.logger.error(f"Process Request Error: {e}")
-            return json.dumps({"status": "error", "message": str(e)})
+            logger.error("Process Request Error: %s", e)
+            return _dumps({"status": "error", "message": str(e)})
+
+    def _route_create_project(self, params: Dict[str, Any]) -> str:
+        # If path is provided, use init logic, else use legacy
+        if "path" in params:
+            return self.init_project_content(params)
+        return self.create_project(params.get("name"), params.get("prompt"), params.get("type", "game"))
 
     # --- HYBRID CONTENT GENERATION (The Fix for Empty Folders) ---
     def init_project_content(self, params: Dict[str, Any]) -> str:
@@ -129,8 +621,36 @@ class Orchestrator:
         project_path = Path(params.get("path", f"output/{project_name}")) 
         prompt = params.get("prompt", "")
 
-        self.logger.info(f"Populating project at: {project_path}")
-        project_path.mkdir(parents=True, exist_ok=True)
+        logger.info("Populating project at: %s", project_path)
+        scripts_dir = project_path / "scripts"
+        needs_scripts = project_type in ["blender", "cad", "movie"]
+        # A single makedirs creates the project folder and, when needed, scripts/ in it
+        self._ensure_dir(scripts_dir if needs_scripts else project_path)
+        self._ensured_dirs.add(project_path)
+
+        # Re-runs with identical params leave the generated files untouched, as
+        # long as every one of them still holds what was written (deleted or
+        # hand-edited files are regenerated)
+        content_key = hashlib.sha256(
+            _dumps([project_name, project_type, prompt, str(project_path)], sort_keys=True).encode()
+        ).hexdigest()
+        generated = [project_path / "manifest.json"]
+        if needs_scripts:
+            generated.append(scripts_dir / "generate_geometry.py")
+        elif project_type == "game":
+            generated.append(project_path / f"{project_name}.uproject")
+        sidecar = project_path / ".manifest.sha"
+        try:
+            stored = _loads(sidecar.read_text())
+            up_to_date = stored["key"] == content_key and stored["files"] == _file_digests(generated)
+        except (OSError, ValueError, KeyError, TypeError):
+            up_to_date = False
+        if up_to_date:
+            return _dumps({
+                "status": "success",
+                "path": str(project_path),
+                "message": f"Project content already up to date in {project_path}"
+            })
 
         manifest = {
             "name": project_name,
@@ -141,32 +661,13 @@ class Orchestrator:
         }
 
         # 1. BLENDER / CAD GEOMETRY GENERATION
-        if project_type in ["blender", "cad", "movie"]:
-            scripts_dir = project_path / "scripts"
-            scripts_dir.mkdir(parents=True, exist_ok=True)
-            
+        if needs_scripts:
             # Generate the Python script that Blender will run to create the mesh
-            script_content = f"""
-import bpy
-# Auto-generated by VrindaAI for project: {project_name}
-# Prompt: {prompt}
-
-def create_scene():
-    # Clear existing
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    
-    # Create Base Geometry (Cube Placeholder for now, AI logic goes here)
-    bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 1))
-    cube = bpy.context.active_object
-    cube.name = "{project_name}_Base"
-    
-    # Save
-    bpy.ops.wm.save_as_mainfile(filepath="{str(project_path).replace(os.sep, '/')}/{project_name}.blend")
-
-if __name__ == "__main__":
-    create_scene()
-"""
+            script_content = _GEOMETRY_SCRIPT_TEMPLATE.substitute(
+                project_name=project_name,
+                prompt=prompt,
+                blend_path=f"{project_path.as_posix()}/{project_name}.blend"
+            )
             script_file = scripts_dir / "generate_geometry.py"
             with open(script_file, "w") as f:
                 f.write(script_content)
@@ -183,137 +684,588 @@ if __name__ == "__main__":
                 "Description": prompt,
                 "Modules": []
             }
-            with open(project_path / f"{project_name}.uproject", "w") as f:
-                json.dump(uproject_content, f, indent=4)
+            _write_json(project_path / f"{project_name}.uproject", uproject_content)
             manifest["status"] = "Unreal Project File Created"
 
         # Save Manifest
-        with open(project_path / "manifest.json", "w") as f:
-            json.dump(manifest, f, indent=4)
+        _write_json(project_path / "manifest.json", manifest)
+        sidecar.write_text(_dumps({"key": content_key, "files": _file_digests(generated)}))
 
-        return json.dumps({
+        return _dumps({
             "status": "success", 
             "path": str(project_path),
             "message": f"Project content initialized in {project_path}"
         })
 
+    # Universal Link method -> handler(self, params) returning the JSON reply
+    _REQUEST_HANDLERS: Dict[str, Callable[..., str]] = {
+        "init_project_content": init_project_content,
+        "create_project": _route_create_project,
+        "status_check": lambda self, params: _STATUS_JSON,
+    }
+
     # --- LEGACY WORKFLOW EXECUTION ---
     def execute_workflow(self, task_spec: Dict[str, Any], mode: ExecutionMode = ExecutionMode.SEQUENTIAL, dry_run: bool = False) -> Dict[str, Any]:
+        raw_engine = task_spec.get("engine")
+        engine = _normalize_engine(raw_engine)
+        if engine != raw_engine:
+            task_spec = {**task_spec, "engine": engine}
         workflow_id = self._generate_workflow_id()
+        desc = str(task_spec.get("description") or "unnamed")
+        logger.info("Starting workflow %s: %.50s", workflow_id, desc)
+        start_ns = time.monotonic_ns()
         result = {
             "workflow_id": workflow_id,
-            "status": WorkflowStatus.RUNNING.value,
-            "engine": task_spec.get("engine")
+            "status": _ST_RUNNING,
+            "engine": engine,
+            # Wall-clock stamps stay integers until a report is written (_ns_to_iso)
+            "start_time_ns": time.time_ns()
         }
 
         try:
-            self._prepare_environment(task_spec, workflow_id)
-            manifests = self._generate_job_manifests(task_spec, workflow_id)
-            
-            if dry_run:
-                return {"status": WorkflowStatus.PENDING.value, "manifests": manifests}
+            artifacts = None
+            kernel_future = None
+            if not dry_run and self.kernel.enabled and _OFFLOAD_RE.search(desc):
+                # Engineering work belongs to the Kernel; local execution is the fallback
+                kernel_future = self.kernel.submit_engineering_task_future(desc)
 
-            exec_res = self._execute_jobs(manifests)
-            
-            if exec_res["overall_status"] == "completed":
-                result["status"] = WorkflowStatus.COMPLETED.value
+            # Local prep overlaps the Kernel round-trip
+            ctx = self._workflow_context(desc, workflow_id)
+            preview = None
+            if kernel_future is not None:
+                if engine == "blender":
+                    # The preview render only waits on the proxy mesh path
+                    preview = _skeleton_manifest(
+                        "blender", "render",
+                        parameters=dict(task_spec),
+                        output={"path": str(ctx.run_dir / "frames")}
+                    )
+                try:
+                    artifacts = kernel_future.result()
+                except Exception as e:
+                    logger.warning("Kernel offload failed (%s); running workflow locally", e)
+
+            if artifacts is not None:
+                result["status"] = _ST_OFFLOADED
+                result["message"] = "Engineering task offloaded to Vryndara Kernel"
+                result["artifacts"] = artifacts
+                proxy_path = artifacts.get("proxy_path") or artifacts.get("proxy")
+                if proxy_path and preview is not None:
+                    preview["parameters"]["assets"] = [proxy_path]
+                    self._ensure_layout(ctx, [preview])
+                    exec_res = self._execute_jobs([preview], self._index_dependencies([preview]), mode)
+                    result["job_results"] = exec_res["job_results"]
+                    if exec_res["overall_status"] != "completed":
+                        # Callers branch on status; a failed preview must not read as success
+                        result["status"] = _ST_FAILED
+                        result["error"] = exec_res.get("error")
             else:
-                result["status"] = WorkflowStatus.FAILED.value
-                result["error"] = exec_res.get("error")
+                manifests = self._generate_job_manifests(task_spec, ctx)
+                self._ensure_layout(ctx, manifests)
+                dependencies = self._index_dependencies(manifests)
+
+                if dry_run:
+                    return {"status": _ST_PENDING, "manifests": manifests}
+
+                exec_res = self._execute_jobs(manifests, dependencies, mode)
+                result["job_results"] = exec_res["job_results"]
+
+                if exec_res["overall_status"] == "completed":
+                    result["status"] = _ST_COMPLETED
+                else:
+                    result["status"] = _ST_FAILED
+                    result["error"] = exec_res.get("error")
 
         except Exception as e:
-            result["status"] = WorkflowStatus.FAILED.value
+            result["status"] = _ST_FAILED
             result["error"] = str(e)
-        
+
+        # Monotonic clock: immune to wall-clock jumps during long renders
+        result["duration"] = (time.monotonic_ns() - start_ns) / 1e9
+        result["end_time_ns"] = time.time_ns()
         self.execution_history.append(result)
+        self._schedule_report(result)
         return result
 
-    def _prepare_environment(self, task_spec: Dict, workflow_id: str):
-        desc = str(task_spec.get("description", "job"))
-        safe_desc = "".join([c for c in desc if c.isalnum() or c in (' ', '-', '_')]).strip()
-        run_dir = self.output_dir / f"{safe_desc[:30]}_{workflow_id}"
-        run_dir.mkdir(parents=True, exist_ok=True)
-        return {"success": True, "run_dir": str(run_dir)}
-
-    def _generate_job_manifests(self, task_spec: Dict, workflow_id: str) -> List[Dict]:
-        engine = task_spec.get("engine")
-        if engine == "unreal":
-            return self._generate_unreal_manifests(task_spec, workflow_id)
-        elif engine == "blender":
-            return self._generate_blender_manifests(task_spec, workflow_id)
-        return []
-
-    def _generate_blender_manifests(self, task_spec: Dict[str, Any], workflow_id: str) -> List[Dict]:
-        desc = str(task_spec.get("description", "unnamed"))
-        safe_desc = "".join([c for c in desc if c.isalnum() or c in (' ', '-', '_')]).strip()
-        project_folder = self.output_dir / f"{safe_desc[:30]}_{workflow_id}"
-        return [{
-            "id": "blender_render",
-            "engine": "blender",
-            "type": "render",
-            "parameters": task_spec,
-            "output": {"path": str(project_folder / "frames")}
-        }]
-
-    def _generate_unreal_manifests(self, task_spec: Dict[str, Any], workflow_id: str) -> List[Dict]:
-        manifests = []
-        project_name = f"VrindaProj_{workflow_id}"
-        project_path = self.unreal_root / project_name
-        
-        manifests.append({
-            "id": "1_create_project",
-            "engine": "unreal",
-            "type": "project_create",
-            "parameters": {"game_type": "game", "quality": "high"},
-            "output": { "path": str(project_path) }
-        })
-        return manifests
+    def _schedule_report(self, result: Dict[str, Any]) -> None:
+        try:
+            future = self._report_writer.submit(self._save_execution_report, dict(result))
+        except RuntimeError:
+            # Writer already shut down by close(): write inline rather than fail the workflow
+            self._save_execution_report(dict(result))
+            return
+        self._pending_writes.add(future)
+        future.add_done_callback(self._pending_writes.discard)
+
+    def _save_execution_report(self, result: Dict[str, Any]) -> None:
+        log_dir = self.output_dir / "logs"
+        try:
+            self._ensure_dir(log_dir)
+            report_path = log_dir / f"workflow_{result.get('workflow_id', 'unknown')}.json"
+            report = _to_jsonable(result)
+            for key in ("start_time", "end_time"):
+                if f"{key}_ns" in report:
+                    report[key] = _ns_to_iso(report[f"{key}_ns"])
+            _write_json(report_path, report)
+        except Exception as e:
+            logger.error("Failed to save execution report: %s", e)
+
+    def close(self) -> None:
+        """Flush pending execution reports, close the Kernel link and stop engine helpers."""
+        self._report_writer.shutdown(wait=True)
+        self.kernel.close()
+        for instance in self._engines.values():
+            close = getattr(instance, "close", None)
+            if close is not None:
+                close()
+
+    def _workflow_context(self, desc: str, workflow_id: str) -> WorkflowContext:
+        """Single source of truth for a workflow's run folder and Unreal project path."""
+        safe_desc = _safe_desc(desc)
+        return WorkflowContext(
+            workflow_id=workflow_id,
+            safe_desc=safe_desc,
+            run_dir=self.output_dir / f"{safe_desc}_{workflow_id}",
+            project_path=self.unreal_root / f"VrindaProj_{workflow_id}"
+        )
 
-    def _execute_jobs(self, manifests: List[Dict]) -> Dict:
-        results = {"overall_status": "completed"}
-        context = {}
+    def _ensure_layout(self, ctx: WorkflowContext, manifests: List[Dict]):
+        """
+        Every directory a workflow writes to, created in one batch before any job
+        runs: the run folder, the report folder, directory outputs (render frame
+        folders) and the parent of every file output. Handlers never mkdir.
+        """
+        dirs = {ctx.run_dir, self.output_dir / "logs"}
         for job in manifests:
-            try:
-                res = self._execute_single_job(job, context)
-                if res["status"] == "failed":
+            if "output" in job:
+                out = Path(job["output"]["path"])
+                dirs.add(out if (job["engine"], job["type"]) in _DIRECTORY_OUTPUTS else out.parent)
+        self._ensure_dirs(dirs)
+        return {"success": True, "run_dir": str(ctx.run_dir)}
+
+    def _generate_job_manifests(self, task_spec: Dict, ctx: WorkflowContext) -> List[Dict]:
+        generator = self._MANIFEST_GENERATORS.get(task_spec.get("engine"))
+        if generator is None:
+            return []
+        # Generators yield jobs lazily; the DAG is validated as a whole before any
+        # job starts, so a bad depends_on can never fail a run halfway through
+        return list(generator(self, task_spec, ctx))
+
+    def _generate_blender_manifests(self, task_spec: Dict[str, Any], ctx: WorkflowContext) -> Iterator[Dict]:
+        # Animated specs render a frame sequence sharded across Blender processes
+        yield _skeleton_manifest(
+            "blender", "render_sequence" if task_spec.get("animation") else "render",
+            parameters=task_spec,
+            output={"path": str(ctx.run_dir / "frames")}
+        )
+
+    def _generate_unreal_manifests(self, task_spec: Dict[str, Any], ctx: WorkflowContext) -> Iterator[Dict]:
+        project_path = ctx.project_path
+        
+        yield _skeleton_manifest(
+            "unreal", "project_create",
+            parameters={"game_type": "game", "quality": "high"},
+            output={"path": str(project_path)}
+        )
+        assets = task_spec.get("assets")
+        if assets:
+            # One job for every asset: a single library scan and manifest write
+            yield _skeleton_manifest(
+                "unreal", "ingest_batch",
+                depends_on=["1_create_project"],
+                parameters={"assets": [str(a) for a in assets], "target_project": str(project_path)},
+                output={"path": str(project_path / "Raw_Downloads")}
+            )
+
+    # Engine -> manifest generator (yielding job dicts). New engines only need to register here.
+    _MANIFEST_GENERATORS: Dict[str, Callable[..., Iterator[Dict]]] = {
+        "unreal": _generate_unreal_manifests,
+        "blender": _generate_blender_manifests,
+    }
+
+    def _index_dependencies(self, manifests: List[Dict]) -> DependencyIndex:
+        """
+        Validate every depends_on reference once and compile the DAG onto
+        integer job indices (positions in manifests): children[i] lists the jobs
+        job i unblocks, remaining[i] counts its unfinished dependencies.
+        """
+        index: Dict[str, int] = {}
+        for i, job in enumerate(manifests):
+            if job["id"] in index:
+                raise ValueError(f"Duplicate job id in manifests: {job['id']}")
+            index[job["id"]] = i
+
+        children: List[List[int]] = [[] for _ in manifests]
+        remaining: List[int] = []
+        for i, job in enumerate(manifests):
+            deps = job.get("depends_on", [])
+            for dep in deps:
+                parent = index.get(dep)
+                if parent is None:
+                    raise ValueError(f"Job {job['id']} depends on unknown job {dep}")
+                children[parent].append(i)
+            remaining.append(len(deps))
+
+        # Kahn pass so dependency cycles are rejected before anything runs
+        pending = list(remaining)
+        ready = [i for i, count in enumerate(pending) if count == 0]
+        visited = 0
+        while ready:
+            visited += 1
+            for child in children[ready.pop()]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+        if visited != len(manifests):
+            raise ValueError("Dependency cycle detected in job manifests")
+
+        return {"children": children, "remaining": remaining}
+
+    def _execute_jobs(
+        self,
+        manifests: List[Dict],
+        dependencies: DependencyIndex,
+        mode: ExecutionMode = ExecutionMode.SEQUENTIAL
+    ) -> Dict:
+        # Engines are created on first use and shared by every job and retry in the run
+        # Parallel workers share this dict; "lock" guards every write to it
+        context: Dict[str, Any] = {"lock": threading.Lock()}
+        if self.config.get("memoize_jobs", True):
+            context["fingerprints"] = self._fingerprint_jobs(manifests)
+
+        if mode == ExecutionMode.PARALLEL and len(manifests) > 1:
+            return self._execute_parallel(manifests, dependencies, context)
+        if mode == ExecutionMode.INTERACTIVE:
+            selected = self._prompt_job_selection(manifests)
+            return self._execute_sequential(manifests, dependencies, context, selected)
+        return self._execute_sequential(manifests, dependencies, context)
+
+    def _prompt_job_selection(self, manifests: List[Dict]) -> Set[int]:
+        """
+        Show the whole job list once and read a single selection such as
+        "1,3-5" or "all" (the default), instead of prompting per job.
+        Returns the selected job indices.
+        """
+        print("\nJobs in this workflow:")
+        for number, job in enumerate(manifests, 1):
+            print(f"  {number:>3}  {job['id']:<24} {job.get('engine', '')}/{job.get('type', '')}")
+        try:
+            answer = input("Execute which jobs? (e.g. 1,3-5,all) [all]: ")
+        except EOFError:
+            return set()
+        return _parse_job_selection(answer, len(manifests))
+
+    def _execute_sequential(
+        self,
+        manifests: List[Dict],
+        dependencies: DependencyIndex,
+        context: Dict,
+        selected: Optional[Set[int]] = None
+    ) -> Dict:
+        results: Dict[str, Any] = {"overall_status": "completed", "job_results": {}}
+        children = dependencies["children"]
+        remaining = list(dependencies["remaining"])
+        ready = deque(i for i, count in enumerate(remaining) if count == 0)
+
+        while ready:
+            idx = ready.popleft()
+            job = manifests[idx]
+            if selected is not None and idx not in selected:
+                # Deselected jobs still release their dependents
+                results["job_results"][job["id"]] = {"status": "skipped"}
+            else:
+                try:
+                    res = self._run_job(job, context)
+                    results["job_results"][job["id"]] = res
+                    if res["status"] == "failed":
+                        results["overall_status"] = "failed"
+                        results["error"] = res.get("error")
+                        break
+                except Exception as e:
                     results["overall_status"] = "failed"
-                    results["error"] = res.get("error")
+                    results["error"] = str(e)
                     break
-            except Exception as e:
-                results["overall_status"] = "failed"
-                results["error"] = str(e)
-                break
+
+            # Completion releases children in O(children) instead of re-scanning depends_on
+            for child in children[idx]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        return results
+
+    def _execute_parallel(self, manifests: List[Dict], dependencies: DependencyIndex, context: Dict) -> Dict:
+        """
+        Run jobs concurrently as soon as their dependencies complete.
+        Engine jobs are subprocess-bound, so a bounded thread pool overlaps them
+        while keeping the shared context dict in one process.
+        """
+        results: Dict[str, Any] = {"overall_status": "completed", "job_results": {}}
+        children = dependencies["children"]
+        remaining = list(dependencies["remaining"])
+        ready = deque(i for i, count in enumerate(remaining) if count == 0)
+        running: Dict[Future, int] = {}
+        max_workers = max(1, int(self.config.get("max_parallel_jobs", 4)))
+        gpu_workers = max(1, int(self.config.get("max_gpu_jobs", 1)))
+
+        pool = _get_job_pool(max_workers)
+        gpu_pool = _get_job_pool(gpu_workers, "gpu")
+
+        while ready or running:
+            while ready:
+                idx = ready.popleft()
+                job = manifests[idx]
+                target = gpu_pool if job.get("type") in _GPU_JOB_TYPES else pool
+                running[target.submit(self._run_job, job, context)] = idx
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                try:
+                    res = future.result()
+                except Exception as e:
+                    res = {"status": "failed", "error": str(e)}
+                results["job_results"][manifests[idx]["id"]] = res
+
+                if res["status"] == "failed":
+                    if results["overall_status"] != "failed":
+                        results["overall_status"] = "failed"
+                        results["error"] = res.get("error")
+                    continue
+
+                for child in children[idx]:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        ready.append(child)
+
+            if results["overall_status"] == "failed":
+                # Stop scheduling new work; let in-flight jobs finish
+                ready.clear()
         return results
 
+    def _run_job(self, job: Dict, context: Dict) -> Dict:
+        """Execute one job through the memo cache and the retry policy."""
+        fingerprint = None
+        if (job["engine"], job["type"]) in _MEMOIZABLE_JOBS:
+            fingerprint = context.get("fingerprints", {}).get(job["id"])
+
+        job_id = job["id"]
+        logger.debug("Executing job %s (%s/%s)", job_id, job["engine"], job["type"])
+        start_ns = time.monotonic_ns()
+        res = self._load_memoized_result(job, fingerprint) if fingerprint else None
+        if res is None:
+            res = self._execute_job_with_retry(job, context)
+            if fingerprint and res.get("status") == "success":
+                self._store_memoized_result(job, fingerprint, res)
+        res = {**res, "duration": (time.monotonic_ns() - start_ns) / 1e9, "timestamp_ns": time.time_ns()}
+
+        # Applied for fresh and cached results alike
+        if res.get("status") == "success" and job["type"] == "project_create":
+            with context["lock"]:
+                context["active_project"] = res["project_file"]
+        return res
+
+    def _fingerprint_jobs(self, manifests: List[Dict]) -> Dict[str, str]:
+        """
+        Hash each manifest (minus its run-specific output path), the size/mtime of
+        its input assets and the fingerprints of the jobs it depends on, so a
+        cached result is only reused when the whole upstream chain is identical.
+        """
+        jobs = {job["id"]: job for job in manifests}
+        fingerprints: Dict[str, str] = {}
+
+        def fingerprint(job_id: str) -> str:
+            if job_id in fingerprints:
+                return fingerprints[job_id]
+            job = jobs[job_id]
+            digest = hashlib.sha256()
+            spec = {k: v for k, v in job.items() if k != "output"}
+            digest.update(_dumps(spec, sort_keys=True).encode())
+            params = job.get("parameters")
+            assets = params.get("assets") if isinstance(params, dict) else None
+            for asset in assets or []:
+                try:
+                    st = os.stat(asset)
+                    digest.update(f"{asset}:{st.st_size}:{st.st_mtime_ns}".encode())
+                except (OSError, TypeError, ValueError):
+                    digest.update(str(asset).encode())
+            for dep in job.get("depends_on", []):
+                digest.update(fingerprint(dep).encode())
+            fingerprints[job_id] = digest.hexdigest()
+            return fingerprints[job_id]
+
+        for job_id in jobs:
+            fingerprint(job_id)
+        return fingerprints
+
+    def _load_memoized_result(self, job: Dict, fingerprint: str) -> Optional[Dict]:
+        """
+        Cached result for fingerprint, with its output copied into this run and
+        every path in it rebased there; None on a miss, a malformed memo, or
+        when any output the cached result names has since disappeared.
+        """
+        memo_file = self.output_dir / ".memo" / f"{fingerprint}.json"
+        try:
+            memo = _loads(memo_file.read_bytes())
+            cached_output = Path(memo["output_path"])
+            result = dict(memo["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if not cached_output.exists():
+            return None
+        old_root = str(cached_output)
+        if not all(Path(p).exists() for p in _paths_under(result, old_root)):
+            return None
+
+        target = Path(job["output"]["path"])
+        if target != cached_output:
+            if cached_output.is_dir():
+                shutil.copytree(cached_output, target, dirs_exist_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(cached_output, target)
+            result = _rebase_paths(result, old_root, str(target))
+
+        logger.info("Job %s reused cached output from %s", job["id"], cached_output)
+        return {**result, "cached": True}
+
+    def _store_memoized_result(self, job: Dict, fingerprint: str, res: Dict) -> None:
+        memo_dir = self.output_dir / ".memo"
+        try:
+            self._ensure_dir(memo_dir)
+            memo = _to_jsonable({"output_path": job["output"]["path"], "result": res})
+            (memo_dir / f"{fingerprint}.json").write_text(_dumps(memo))
+        except OSError as e:
+            logger.warning("Could not store memoized result for %s: %s", job["id"], e)
+
+    def _execute_job_with_retry(self, job: Dict, context: Dict) -> Dict:
+        """Run a job, retrying transient engine failures with exponential backoff."""
+        retries = self.config.get("max_retries", 2) if self.config.get("retry_failed", True) else 0
+        delay = self.config.get("retry_delay", 1.0)
+        # Each retry starts from a pristine manifest, whatever the failed attempt mutated
+        pristine = _clone_manifest(job) if retries else None
+        attempt = 0
+        while True:
+            try:
+                return self._execute_single_job(_clone_manifest(pristine) if attempt else job, context)
+            except TransientEngineError as e:
+                if attempt >= retries:
+                    if e.result is not None:
+                        return e.result
+                    raise
+                wait = delay * (2 ** attempt)
+                attempt += 1
+                logger.warning("Job %s failed (%s); retry %d/%d in %.1fs", job.get("id"), e, attempt, retries, wait)
+                time.sleep(wait)
+
     def _execute_single_job(self, job: Dict, context: Dict) -> Dict:
+        try:
+            res = self._dispatch_job(job, context)
+        except FileNotFoundError:
+            # Missing engine install or input: retrying will not help
+            raise
+        except OSError as e:
+            raise TransientEngineError(str(e)) from e
+        # Engines report crashes, timeouts and spawn errors as failed results
+        # flagged transient rather than raising
+        if res.get("status") == "failed" and res.get("transient"):
+            raise TransientEngineError(res.get("error") or "Transient engine failure", res)
+        return res
+
+    # Engine name -> wrapper factory used by _get_engine
+    _ENGINE_FACTORIES: Dict[str, Callable[[], Any]] = {
+        "unreal": _lazy_factory("src.engines.unreal_engine", "create_unreal_engine"),
+        "blender": _lazy_factory("src.engines.blender_engine", "create_blender_engine"),
+        "ffmpeg": _lazy_factory("src.engines.ffmpeg_engine", "create_ffmpeg_engine"),
+    }
+
+    def _get_engine(self, engine: str) -> Any:
+        """Return this Orchestrator's wrapper for engine, creating it on first use."""
+        instance = self._engines.get(engine)
+        if instance is None:
+            with self._engines_lock:
+                # Re-check under the lock so concurrent jobs build one wrapper
+                instance = self._engines.get(engine)
+                if instance is None:
+                    error = self._engine_errors.get(engine)
+                    if error is not None:
+                        raise error
+                    try:
+                        instance = self._engines[engine] = self._ENGINE_FACTORIES[engine]()
+                    except (ImportError, FileNotFoundError) as e:
+                        self._engine_errors[engine] = e
+                        raise
+        return instance
+
+    def _handle_unreal_project_create(self, job: Dict, ue_wrapper: "UnrealEngine") -> Dict:
+        target_path = Path(job["output"]["path"])
+        # FIXED: Removed 'project_type' arg
+        return ue_wrapper.create_project(
+            project_name=target_path.name,
+            target_dir=str(target_path.parent)
+        )
+
+    def _handle_blender_render(self, job: Dict, blender) -> Dict:
+        # Paths come from our own generators: no Path re-parsing needed
+        out_path_str = job["output"]["path"]
+        return blender.render_from_spec(job["parameters"], out_path_str)
+
+    def _handle_blender_render_sequence(self, job: Dict, blender) -> Dict:
+        return blender.render_sequence(job["parameters"], job["output"]["path"])
+
+    def _handle_unreal_ingest_batch(self, job: Dict, ue_wrapper: "UnrealEngine") -> Dict:
+        params = job["parameters"]
+        assets = self.asset_manager.ingest_assets_batch(params["assets"], params["target_project"])
+        failed = [name for name, res in assets.items() if res["status"] != "success"]
+        if failed:
+            return {"status": "failed", "error": f"Could not ingest: {', '.join(failed)}", "assets": assets}
+        return {"status": "success", "assets": assets}
+
+    def _handle_ffmpeg_stitch_and_concat(self, job: Dict, ffmpeg) -> Dict:
+        # One ffmpeg run for "stitch the frames, then append these clips"
+        params = job["parameters"]
+        return ffmpeg.stitch_and_concat(
+            params["image_sequence_pattern"],
+            params.get("clip_paths", []),
+            job["output"]["path"],
+            framerate=params.get("framerate", 24),
+            quality=params.get("quality", "high"),
+            resolution=params.get("resolution", "1920x1080")
+        )
+
+    # (engine, job type) -> handler(self, job, engine_wrapper): one hash lookup per
+    # dispatch. New job kinds only need to register here.
+    _HANDLERS: Dict[Tuple[str, str], Callable[..., Dict]] = {
+        ("unreal", "project_create"): _handle_unreal_project_create,
+        ("unreal", "ingest_batch"): _handle_unreal_ingest_batch,
+        ("blender", "render"): _handle_blender_render,
+        ("blender", "render_sequence"): _handle_blender_render_sequence,
+        ("ffmpeg", "stitch_and_concat"): _handle_ffmpeg_stitch_and_concat,
+    }
+
+    def _dispatch_job(self, job: Dict, context: Dict) -> Dict:
         engine = job["engine"]
-        
-        if engine == "unreal":
-            ue_wrapper: UnrealEngine = create_unreal_engine()
-            if job["type"] == "project_create":
-                target_path = Path(job["output"]["path"])
-                # FIXED: Removed 'project_type' arg
-                res = ue_wrapper.create_project(
-                    project_name=target_path.name,
-                    target_dir=str(target_path.parent)
-                )
-                if res["status"] == "success":
-                    context["active_project"] = res["project_file"]
-                return res
-
-        elif engine == "blender":
-            return {"status": "success", "message": "Blender job dispatched"}
-
-        return {"status": "success"} # Default pass
+        handler = self._HANDLERS.get((engine, job["type"]))
+        if handler is None:
+            return {"status": "success"} # Default pass
+        return handler(self, job, self._get_engine(engine))
+
+    def get_execution_history(self) -> List[Dict[str, Any]]:
+        return list(self.execution_history)
 
     def _generate_workflow_id(self):
-        import uuid
-        return str(uuid.uuid4())[:8]
+        # Random per-process prefix + counter: no entropy read per workflow, and ids
+        # from restarted processes (recycled PIDs) still land in distinct folders
+        return f"{_WORKFLOW_ID_PREFIX}{next(_WORKFLOW_ID_COUNTER):02x}"
 
     def create_project(self, name: str, prompt: str, type: str = "game") -> str:
+        """Universal Link form of _create_project_dict: the result is stringified once, here."""
+        return _dumps(self._create_project_dict(name, prompt, type))
+
+    def _create_project_dict(self, name: str, prompt: str, type: str = "game") -> Dict[str, Any]:
+        """Create a project and return the workflow result dict, for in-process callers."""
         task_spec = {"engine": "unreal", "description": prompt}
-        result = self.execute_workflow(task_spec)
-        return json.dumps(result, default=str)
+        return self.execute_workflow(task_spec)
 
 def create_orchestrator(config: Optional[Dict] = None) -> Orchestrator:
     return Orchestrator(config)
\ No newline at end of file
@@ -5,24 +5,283 @@ Roles:
 2. The "Renderer": Handles pure Blender rendering workflows.
 """
 
+import asyncio
 import subprocess
 import json
 import logging
 import os
+import queue
 import shutil
-from typing import Dict, Any, Optional, List
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from pathlib import Path
 import tempfile
 import sys
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Common Windows install locations, newest first
+COMMON_BLENDER_PATHS = (
+    r"C:\Program Files\Blender Foundation\Blender 4.3\blender.exe",
+    r"C:\Program Files\Blender Foundation\Blender 4.2\blender.exe",
+    r"C:\Program Files\Blender Foundation\Blender 4.1\blender.exe",
+    r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
+    r"C:\Program Files (x86)\Blender Foundation\Blender\blender.exe",
+)
+
+# Static scripts run inside Blender; parameters follow "--" as inline JSON, or as
+# a JSON sidecar path when too long for the command line
+BLENDER_SCRIPTS_DIR = Path(__file__).resolve().parent / "blender_scripts"
+
+# Params JSON shorter than this goes inline on the command line. Windows caps the
+# whole command line at 32767 characters and list2cmdline backslash-escapes every
+# quote, so keep well clear of it; Linux allows 128 KiB per argv element
+INLINE_PARAMS_LIMIT = 8000 if os.name == "nt" else 60000
+
+# Wall-clock limit for one Blender subprocess, in seconds
+BLENDER_TIMEOUT = 3600
+
+# Output lines kept from a one-shot Blender run for its failure report
+ERROR_TAIL_LINES = 200
+
+# Meshes denser than this skip heat-diffusion auto weights (O(verts x bones))
+# in favour of vectorized distance-to-bone weights
+AUTO_WEIGHT_VERTEX_LIMIT = 50000
+
+# Blender image formats the render script can write, with their file extensions
+RENDER_FORMAT_EXTENSIONS = {
+    "PNG": ".png",
+    "JPEG": ".jpg",
+    "OPEN_EXR": ".exr",
+}
+
+# Discovered executables persist across processes; bump the version whenever the
+# probe list changes so stale entries are ignored
+ENGINE_CACHE_FILE = Path.home() / ".cache" / "vrindaai" / "engines.json"
+ENGINE_CACHE_VERSION = 1
+
+
+def _read_engine_cache(name: str) -> Optional[str]:
+    try:
+        entry = json.loads(ENGINE_CACHE_FILE.read_text()).get(name) or {}
+    except (OSError, ValueError, AttributeError):
+        return None
+    if entry.get("version") != ENGINE_CACHE_VERSION:
+        return None
+    return entry.get("path")
+
+
+def _write_engine_cache(name: str, path: str) -> None:
+    try:
+        try:
+            cache = json.loads(ENGINE_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        cache[name] = {"path": path, "version": ENGINE_CACHE_VERSION}
+        ENGINE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent starts never read a torn file
+        tmp = ENGINE_CACHE_FILE.with_name(f"{ENGINE_CACHE_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cache, indent=2))
+        os.replace(tmp, ENGINE_CACHE_FILE)
+    except OSError as e:
+        logger.debug("Could not update engine cache: %s", e)
+
+
+@contextmanager
+def _params_arg(params: Dict[str, Any]) -> Iterator[str]:
+    """The argument after "--": the params JSON itself, or a temp file holding it above INLINE_PARAMS_LIMIT."""
+    data = json.dumps(params, default=str)
+    if len(data) < INLINE_PARAMS_LIMIT:
+        yield data
+        return
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
+        f.write(data)
+        params_path = f.name
+    try:
+        yield params_path
+    finally:
+        Path(params_path).unlink(missing_ok=True)
+
+
+def _is_crash(returncode: int) -> bool:
+    """Killed by a signal (POSIX) or an NTSTATUS exception code (Windows), not a script error."""
+    return returncode < 0 or returncode >= 0xC0000000
+
+
+@lru_cache(maxsize=4)
+def _probe_blender(candidates: Tuple[str, ...] = COMMON_BLENDER_PATHS) -> Optional[str]:
+    """PATH + install-location probe, once per process per candidate list."""
+    # Check PATH first
+    blender_exe = shutil.which("blender")
+    if blender_exe:
+        return blender_exe
+
+    for path in candidates:
+        if Path(path).exists():
+            return path
+    return None
+
+
+# CPython launches via posix_spawn (vfork-style, no page-table copy of a large
+# parent) only when close_fds is off; our own fds are non-inheritable (PEP 446)
+_SPAWN_KWARGS: Dict[str, Any] = {"close_fds": False} if os.name == "posix" else {}
+
+
+# Completion line the daemon driver prints after each request, followed by the exit code.
+# The driver starts it with a newline so it never lands mid-line after unterminated output.
+_DAEMON_DONE = b"__VRINDA_DONE__"
+
+# Seconds without a request after which the daemon's Blender is shut down
+DAEMON_IDLE_TIMEOUT = 300
+
+
+def _pump_lines(stream, lines: "queue.Queue[Optional[bytes]]") -> None:
+    """Reader thread: move the daemon's output lines into a queue; None marks EOF."""
+    try:
+        for line in stream:
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    finally:
+        lines.put(None)
+
+
+class _BlenderDaemon:
+    """
+    One long-lived headless Blender running blender_scripts/stdin_driver.py and
+    fed JSON requests over stdin, so a chain of scene operations pays Blender's
+    startup once instead of once per call. Each request starts from the factory
+    scene, as a one-shot run does. Started on first request and stopped after
+    DAEMON_IDLE_TIMEOUT seconds without one.
+    """
+
+    def __init__(self, blender_path: str):
+        self.blender_path = blender_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle_timer: Optional[threading.Timer] = None
+        self._last_used = 0.0
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [self.blender_path, "-b", "--factory-startup", "-P", str(BLENDER_SCRIPTS_DIR / "stdin_driver.py")],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                **_SPAWN_KWARGS
+            )
+            # Read on a thread so requests can wait with a deadline
+            self._lines = queue.Queue()
+            threading.Thread(
+                target=_pump_lines, args=(self._process.stdout, self._lines),
+                name="vrinda-blender-daemon", daemon=True
+            ).start()
+        return self._process
+
+    def request(self, message: Dict[str, Any]) -> Optional[int]:
+        """
+        Send one JSON request ({"op": ...} for an ops.py handler) and return its
+        exit code; None if the daemon died before finishing it. Raises
+        TimeoutError (after killing the daemon) if no answer arrives within
+        BLENDER_TIMEOUT seconds.
+        """
+        data = json.dumps(message, default=str).encode("ascii") + b"\n"
+        with self._lock:
+            try:
+                process = self._ensure_process()
+                lines = self._lines
+                process.stdin.write(data)
+                process.stdin.flush()
+                deadline = time.monotonic() + BLENDER_TIMEOUT
+                held = None
+                while True:
+                    line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                    if line is None:
+                        break
+                    if line.startswith(_DAEMON_DONE):
+                        # held is the newline the driver put before the marker
+                        self._last_used = time.monotonic()
+                        self._arm_idle_timer()
+                        return int(line[len(_DAEMON_DONE):])
+                    if held is not None:
+                        self._echo(held)
+                    held = line if not line.strip() else None
+                    if held is None:
+                        self._echo(line)
+            except queue.Empty:
+                self._discard()
+                raise TimeoutError(f"Blender daemon request exceeded {BLENDER_TIMEOUT}s")
+            except (OSError, ValueError) as e:
+                logger.warning("Blender daemon failed: %s", e)
+            self._discard()
+            return None
+
+    @staticmethod
+    def _echo(line: bytes) -> None:
+        # Same gate as one-shot runs: Blender output is passed through only at INFO
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        sink = getattr(sys.stdout, "buffer", None)
+        if sink is not None:
+            sink.write(line)
+        else:
+            sys.stdout.write(line.decode("utf-8", errors="replace"))
+
+    def _arm_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+        self._idle_timer = threading.Timer(DAEMON_IDLE_TIMEOUT, self._close_if_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _close_if_idle(self) -> None:
+        with self._lock:
+            if time.monotonic() - self._last_used < DAEMON_IDLE_TIMEOUT:
+                return
+            logger.debug("Blender daemon idle for %ss, stopping it", DAEMON_IDLE_TIMEOUT)
+            self._stop()
+
+    def _discard(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            self._stop()
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            # EOF ends the request loop and Blender exits normally
+            process.stdin.close()
+            process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
 
 class BlenderEngine:
     """
     Blender automation engine.
     Handles Asset Processing (AAA Pipeline) and Rendering (Legacy Pipeline).
     """
+
+    _BLENDER_PATH: Optional[str] = None
     
     def __init__(self, blender_path: Optional[str] = None):
         """
@@ -32,29 +291,34 @@ class BlenderEngine:
         self.blender_path = blender_path or self._find_blender()
         if not self.blender_path:
             raise FileNotFoundError("Blender executable not found in system PATH or standard locations.")
+        # Scene operations share one Blender, started on first use
+        self._daemon = _BlenderDaemon(str(self.blender_path))
+
+    def close(self) -> None:
+        """Stop the scene-operation daemon, if it was started."""
+        self._daemon.close()
+
+    def __del__(self):
+        daemon = getattr(self, "_daemon", None)
+        if daemon is not None:
+            daemon.close()
     
     def _find_blender(self) -> Optional[str]:
-        """Find Blender executable"""
-        import shutil
-        # Check PATH first
-        blender_exe = shutil.which("blender")
+        """Find Blender executable, trusting the on-disk cache while its path still exists"""
+        # Resolved once per process; later engines skip the cache read and stat
+        if BlenderEngine._BLENDER_PATH:
+            return BlenderEngine._BLENDER_PATH
+
+        cached = _read_engine_cache("blender")
+        if cached and Path(cached).exists():
+            BlenderEngine._BLENDER_PATH = cached
+            return cached
+
+        blender_exe = _probe_blender()
         if blender_exe:
-            return blender_exe
-        
-        # Check common Windows paths
-        common_paths = [
-            r"C:\Program Files\Blender Foundation\Blender 4.3\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.2\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.1\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
-            r"C:\Program Files (x86)\Blender Foundation\Blender\blender.exe"
-        ]
-        
-        for path in common_paths:
-            if Path(path).exists():
-                return path
-        
-        return None
+            _write_engine_cache("blender", blender_exe)
+            BlenderEngine._BLENDER_PATH = blender_exe
+        return blender_exe
 
     # ==========================================
     # PHASE 2: ASSET PROCESSING (The "Auto-Rigger")
@@ -65,115 +329,33 @@ class BlenderEngine:
         input_path: str,
         output_path: str,
         rig_type: str = "basic_human", # options: basic_human, basic_quadruped
-        export_format: str = "fbx"
+        export_format: str = "fbx",
+        preview_size: int = 0
     ) -> Dict[str, Any]:
         """
         AAA Pipeline Function:
         Ingests a raw mesh (obj/glb), cleans it, auto-rigs it using Rigify,
         and exports a clean FBX ready for Unreal Engine.
+        With preview_size > 0 the same Blender run also writes a square PNG
+        thumbnail next to the FBX, returned as "preview_path".
         """
         self.logger.info(f"Processing asset for Unreal: {input_path} -> {output_path}")
         
         # Ensure output dir exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Blender Python Script to run headless
-        script = f"""
-import bpy
-import os
-
-# 1. Clear Default Scene
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
-# 2. Import Asset
-input_file = r"{input_path}"
-ext = os.path.splitext(input_file)[1].lower()
-
-try:
-    if ext == ".obj":
-        bpy.ops.wm.obj_import(filepath=input_file)
-    elif ext == ".fbx":
-        bpy.ops.import_scene.fbx(filepath=input_file)
-    elif ext in [".glb", ".gltf"]:
-        bpy.ops.import_scene.gltf(filepath=input_file)
-    else:
-        print(f"ERROR: Unsupported format {{ext}}")
-        exit(1)
-except Exception as e:
-    print(f"ERROR: Import failed: {{e}}")
-    exit(1)
-
-# Select the imported mesh
-mesh_obj = None
-for obj in bpy.context.selected_objects:
-    if obj.type == 'MESH':
-        mesh_obj = obj
-        break
-
-if not mesh_obj:
-    print("ERROR: No mesh found in imported file")
-    exit(1)
-
-# 3. Auto-Rigging (Rigify Integration)
-# Enable Rigify addon if not enabled
-if 'rigify' not in bpy.context.preferences.addons:
-    bpy.ops.preferences.addon_enable(module="rigify")
-
-# Deselect all, select mesh
-bpy.ops.object.select_all(action='DESELECT')
-mesh_obj.select_set(True)
-bpy.context.view_layer.objects.active = mesh_obj
-
-# Center mesh
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='MEDIAN')
-mesh_obj.location = (0,0,0)
-
-# Add Rig
-if "{rig_type}" == "basic_quadruped":
-    bpy.ops.object.armature_basic_quadruped_add()
-else:
-    bpy.ops.object.armature_human_metarig_add()
-
-metarig = bpy.context.object
-metarig.name = "Root"
-
-# Naive Scaling: Scale rig to match mesh height approximately
-# (A real production script would allow manual bone placement or use ML for keypoint detection)
-dim_z = mesh_obj.dimensions.z
-# Assuming standard metarig is ~2m tall. Scale accordingly.
-scale_factor = dim_z / 1.8 
-metarig.scale = (scale_factor, scale_factor, scale_factor)
-bpy.ops.object.transform_apply(scale=True)
-
-# Parent Mesh to Rig with Automatic Weights
-bpy.ops.object.select_all(action='DESELECT')
-mesh_obj.select_set(True)
-metarig.select_set(True)
-bpy.context.view_layer.objects.active = metarig
-
-try:
-    bpy.ops.object.parent_set(type='ARMATURE_AUTO')
-    print("Rigging applied with automatic weights.")
-except Exception as e:
-    print(f"WARNING: Auto-weighting failed: {{e}}")
-
-# 4. Export for Unreal (FBX)
-out_file = r"{output_path}"
-bpy.ops.export_scene.fbx(
-    filepath=out_file,
-    use_selection=True,
-    global_scale=1.0,
-    apply_unit_scale=True,
-    bake_anim=False,
-    object_types={{'ARMATURE', 'MESH'}},
-    mesh_smooth_type='FACE',
-    add_leaf_bones=False, # Critical for Unreal Engine compatibility
-    primary_bone_axis='Y', 
-    secondary_bone_axis='X'
-)
-print("SUCCESS: Export complete")
-"""
-        return self._execute_blender(script, {})
+        preview_path = Path(output_path).with_suffix(".png") if preview_size > 0 else None
+        result = self._run_blender_script("process_asset.py", {
+            "input_path": str(input_path),
+            "output_path": str(output_path),
+            "rig_type": rig_type,
+            "auto_weight_vertex_limit": AUTO_WEIGHT_VERTEX_LIMIT,
+            "preview_path": str(preview_path) if preview_path else None,
+            "preview_size": preview_size,
+        })
+        if preview_path and result.get("status") == "success" and preview_path.exists():
+            result["preview_path"] = str(preview_path)
+        return result
 
     # ==========================================
     # LEGACY / HYBRID: RENDERING & SCENE CREATION
@@ -191,12 +373,128 @@ print("SUCCESS: Export complete")
         self.logger.info(f"Starting Blender render: {desc[:50]}...")
         
         try:
-            blender_script = self._generate_render_script(spec, output_dir)
-            result = self._execute_blender(blender_script, spec)
-            return result
+            return self._run_blender_script("render.py", self._render_params(spec, output_dir))
         except Exception as e:
             self.logger.error(f"Blender render failed: {e}")
             return {"status": "failed", "error": str(e)}
+
+    def render_sequence(
+        self,
+        spec: Dict[str, Any],
+        output_dir: str
+    ) -> Dict[str, Any]:
+        """
+        Render a turntable frame range, split into contiguous shards that run as
+        concurrent Blender processes (blender -b -P render.py -s X -e Y -a).
+        spec["gpu_ids"] pins one shard per GPU through CUDA_VISIBLE_DEVICES;
+        otherwise spec["render_workers"] shards share the machine (default 1).
+        """
+        fps = int(spec.get("fps", 24))
+        frame_start = int(spec.get("frame_start", 1))
+        frame_end = int(spec.get("frame_end") or frame_start + round(float(spec.get("duration", 5)) * fps) - 1)
+        if frame_end < frame_start:
+            return {"status": "failed", "error": f"Empty frame range {frame_start}-{frame_end}"}
+        gpu_ids = [str(g) for g in spec.get("gpu_ids") or []]
+        workers = len(gpu_ids) or max(1, int(spec.get("render_workers", 1)))
+        self.logger.info(f"Rendering frames {frame_start}-{frame_end} in {workers} shard(s)")
+
+        params = self._render_params(spec, output_dir)
+        unique_id = params["filename"].split("_render")[0]
+        params.update(
+            animation=True,
+            frame_start=frame_start,
+            frame_end=frame_end,
+            fps=fps,
+            # Blender replaces #### with the frame number and appends the extension
+            filename=f"{unique_id}_####"
+        )
+
+        processes: List[subprocess.Popen] = []
+        try:
+            # Shards share identical params: inline JSON, a temp file only when oversized
+            with _params_arg(params) as params_arg:
+                shards = self._frame_shards(frame_start, frame_end, workers)
+                for i, (start, end) in enumerate(shards):
+                    processes.append(self._render_shard(params_arg, start, end, gpu_ids[i] if gpu_ids else None))
+                # One deadline for the whole sequence: shards run side by side
+                deadline = time.monotonic() + BLENDER_TIMEOUT
+                failed, crashed = [], False
+                for shard, proc in zip(shards, processes):
+                    try:
+                        returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+                    except subprocess.TimeoutExpired:
+                        self._kill_shards(processes)
+                        return {"status": "failed", "error": f"Blender sequence timed out after {BLENDER_TIMEOUT}s",
+                                "transient": True}
+                    if returncode != 0:
+                        failed.append(shard)
+                        crashed = crashed or _is_crash(returncode)
+        except Exception as e:
+            # A failed launch must not leave the shards already started running unattended
+            self._kill_shards(processes)
+            self.logger.error(f"Blender sequence render failed: {e}")
+            transient = isinstance(e, OSError) and not isinstance(e, FileNotFoundError)
+            return {"status": "failed", "error": str(e), "transient": transient}
+
+        extension = RENDER_FORMAT_EXTENSIONS.get(params["file_format"], ".png")
+        try:
+            prefix = f"{unique_id}_"
+            frame_count = sum(
+                1 for name in os.listdir(output_dir)
+                if name.startswith(prefix) and name.endswith(extension)
+                and name[len(prefix):-len(extension)].isdigit()
+            )
+        except OSError:
+            frame_count = 0
+
+        if failed:
+            ranges = ", ".join(f"{start}-{end}" for start, end in failed)
+            return {"status": "failed", "error": f"Blender failed on frames {ranges}", "frame_count": frame_count,
+                    "transient": crashed}
+        return {"status": "success", "frame_count": frame_count, "shards": len(shards)}
+
+    @staticmethod
+    def _kill_shards(processes: List[subprocess.Popen]) -> None:
+        for proc in processes:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+    @staticmethod
+    def _frame_shards(frame_start: int, frame_end: int, workers: int) -> List[Tuple[int, int]]:
+        """Split an inclusive frame range into at most workers contiguous chunks."""
+        total = frame_end - frame_start + 1
+        workers = max(1, min(workers, total))
+        size, extra = divmod(total, workers)
+        shards = []
+        start = frame_start
+        for i in range(workers):
+            end = start + size - 1 + (1 if i < extra else 0)
+            shards.append((start, end))
+            start = end + 1
+        return shards
+
+    def _render_shard(self, params_arg: str, start: int, end: int, gpu_id: Optional[str]) -> subprocess.Popen:
+        """
+        Launch one Blender rendering frames start..end. Its output goes straight
+        to our stdout at INFO, like a one-shot run's, and is discarded otherwise.
+        """
+        env = None
+        if gpu_id is not None:
+            env = {**os.environ, "CUDA_VISIBLE_DEVICES": gpu_id}
+        cmd = [
+            str(self.blender_path),
+            "-b",  # Headless
+            "--factory-startup",
+            "-P", str(BLENDER_SCRIPTS_DIR / "render.py"),
+            "-s", str(start),
+            "-e", str(end),
+            "-a",
+            "--", params_arg
+        ]
+        if self.logger.isEnabledFor(logging.INFO):
+            return subprocess.Popen(cmd, env=env, **_SPAWN_KWARGS)
+        return subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, **_SPAWN_KWARGS)
     
     def create_scene(
         self,
@@ -206,10 +504,11 @@ print("SUCCESS: Export complete")
     ) -> Dict[str, Any]:
         """Create 3D scene from description"""
         self.logger.info(f"Creating Blender scene: {description[:50]}...")
-        script = self._generate_scene_creation_script(description, assets, style)
-        return self._execute_blender(script, {
+        return self._run_scene_op({
+            "op": "create_scene",
             "description": description,
-            "scene_creation": True
+            "assets": assets,
+            "style": style
         })
 
     def apply_material(
@@ -218,20 +517,13 @@ print("SUCCESS: Export complete")
         material_params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Apply material to object"""
-        script = f"""
-import bpy
-obj = bpy.data.objects.get('{object_name}')
-if obj:
-    mat = bpy.data.materials.new(name="{object_name}_material")
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes["Principled BSDF"]
-    bsdf.inputs['Base Color'].default_value = {tuple(material_params.get('color', [1,1,1,1]))}
-    bsdf.inputs['Metallic'].default_value = {material_params.get('metallic', 0.0)}
-    bsdf.inputs['Roughness'].default_value = {material_params.get('roughness', 0.5)}
-    obj.data.materials.append(mat)
-    print(f"Material applied to {{obj.name}}")
-"""
-        return self._execute_script(script)
+        return self._run_scene_op({
+            "op": "apply_material",
+            "object_name": object_name,
+            "color": list(material_params.get('color', [1,1,1,1])),
+            "metallic": material_params.get('metallic', 0.0),
+            "roughness": material_params.get('roughness', 0.5)
+        })
 
     def add_animation(
         self,
@@ -242,85 +534,48 @@ if obj:
         anim_type = animation.get("type")
         duration = animation.get("duration", 120)
         
-        script = f"""
-import bpy
-obj = bpy.data.objects.get('{object_name}')
-if obj:
-    obj.animation_data_clear()
-"""
+        params: Dict[str, Any] = {"op": "add_animation", "object_name": object_name}
         if anim_type == "rotation":
-            script += f"""
-    obj.rotation_euler = {tuple(animation.get('start_rotation', [0,0,0]))}
-    obj.keyframe_insert(data_path='rotation_euler', frame={animation.get('start_frame', 1)})
-    obj.rotation_euler = {tuple(animation.get('end_rotation', [0,0,6.28]))}
-    obj.keyframe_insert(data_path='rotation_euler', frame={animation.get('end_frame', duration)})
-"""
+            params.update(
+                data_path="rotation_euler",
+                start_value=list(animation.get('start_rotation', [0,0,0])),
+                end_value=list(animation.get('end_rotation', [0,0,6.28]))
+            )
         elif anim_type == "location":
-            script += f"""
-    obj.location = {tuple(animation.get('start_pos', [0,0,0]))}
-    obj.keyframe_insert(data_path='location', frame={animation.get('start_frame', 1)})
-    obj.location = {tuple(animation.get('end_pos', [0,0,10]))}
-    obj.keyframe_insert(data_path='location', frame={animation.get('end_frame', duration)})
-"""
-        script += f"    print(f'Animation added to {{obj.name}}')"
-        return self._execute_script(script)
+            params.update(
+                data_path="location",
+                start_value=list(animation.get('start_pos', [0,0,0])),
+                end_value=list(animation.get('end_pos', [0,0,10]))
+            )
+        params["start_frame"] = animation.get('start_frame', 1)
+        params["end_frame"] = animation.get('end_frame', duration)
+        return self._run_scene_op(params)
 
     def setup_camera(self, camera_params: Dict[str, Any]) -> Dict[str, Any]:
         """Setup camera for rendering"""
-        position = camera_params.get("position", [0, 0, 10])
-        rotation = camera_params.get("rotation", [0, 0, 0])
-        fov = camera_params.get("fov", 50)
-        
-        script = f"""
-import bpy
-camera = None
-for obj in bpy.data.objects:
-    if obj.type == 'CAMERA':
-        camera = obj
-        break
-if not camera:
-    bpy.ops.object.camera_add()
-    camera = bpy.context.active_object
-camera.location = {tuple(position)}
-camera.rotation_euler = {tuple(rotation)}
-camera.data.lens = {fov}
-bpy.context.scene.camera = camera
-print(f"Camera setup complete")
-"""
-        return self._execute_script(script)
+        return self._run_scene_op({
+            "op": "setup_camera",
+            "position": list(camera_params.get("position", [0, 0, 10])),
+            "rotation": list(camera_params.get("rotation", [0, 0, 0])),
+            "fov": camera_params.get("fov", 50)
+        })
 
     def setup_lighting(self, lighting_config: Dict[str, Any]) -> Dict[str, Any]:
         """Setup lighting for scene"""
-        script = f"""
-import bpy
-# Clear existing lights
-for obj in bpy.data.objects:
-    if obj.type == 'LIGHT':
-        bpy.data.objects.remove(obj, do_unlink=True)
-lights_config = {json.dumps(lighting_config)}
-for light_name, config in lights_config.items():
-    bpy.ops.object.light_add(
-        type=config.get('type', 'SUN'),
-        location=config.get('position', [0,0,5])
-    )
-    light = bpy.context.active_object
-    light.data.energy = config.get('energy', 1000)
-    print(f"Light added: {{light_name}}")
-"""
-        return self._execute_script(script)
+        return self._run_scene_op({"op": "setup_lighting", "lights": lighting_config})
 
     # ==========================================
     # HELPER METHODS
     # ==========================================
 
-    def _generate_render_script(self, spec: Dict, output_dir: str) -> str:
+    def _render_params(self, spec: Dict, output_dir: str) -> Dict[str, Any]:
+        """Resolve every render setting in Python; render.py only applies them."""
         quality = spec.get("quality", "high")
         assets = spec.get("assets", []) 
         
         # --- FIX: GENERATE UNIQUE ID ---
         # 1. Try to get ID from filename (e.g. "143f8d3e" from "143f8d3e_manufacturing.stl")
         # 2. Fallback to timestamp
-        import time
         unique_id = f"render_{int(time.time())}"
         if assets and hasattr(assets[0], 'split'):
              try:
@@ -331,184 +586,160 @@ for light_name, config in lights_config.items():
                  pass
         # -------------------------------
 
-        engine_type = 'BLENDER_EEVEE_NEXT' if quality in ['low', 'medium'] else 'CYCLES'
-        file_format = 'OPEN_EXR' if quality == 'raw' else 'PNG'
-        
-        script = f"""
-import bpy
-import os
-import mathutils
-
-# 1. CLEAN SCENE
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
-# 2. IMPORT ASSETS
-assets = {json.dumps(assets)}
-imported_objects = []
+        file_format = self._render_output_format(spec)
+        return {
+            "assets": [str(a) for a in assets],
+            "output_dir": str(output_dir),
+            # Preview tiers rasterize; everything else path traces
+            "engine": 'BLENDER_EEVEE_NEXT' if quality in ['draft', 'low', 'medium'] else 'CYCLES',
+            # Cycles samples per frame; None keeps Blender's scene default
+            "samples": int(spec["samples"]) if spec.get("samples") else None,
+            "file_format": file_format,
+            "jpeg_quality": 95 if file_format == 'JPEG' else None,
+            **self._render_depth_settings(file_format, quality),
+            # Unchanging geometry keeps its BVH between frames; non-VFX output skips the compositor
+            "static_scene": bool(spec.get("geometry_static", True)),
+            "filename": f"{unique_id}_render{RENDER_FORMAT_EXTENSIONS.get(file_format, '.png')}",
+        }
+
+    @staticmethod
+    def _render_depth_settings(file_format: str, quality: str) -> Dict[str, Any]:
+        """
+        Bytes per frame by tier: EXR is half float with lossy DWAA unless the
+        tier needs full float (ultra/raw, lossless ZIP); PNG stays 8-bit.
+        """
+        if file_format == 'OPEN_EXR':
+            full_float = quality in ('ultra', 'raw')
+            return {"color_depth": '32' if full_float else '16', "exr_codec": 'ZIP' if full_float else 'DWAA'}
+        if file_format == 'PNG':
+            return {"color_depth": '8', "png_compression": 15}
+        return {}
+
+    @staticmethod
+    def _render_output_format(spec: Dict) -> str:
+        """
+        Pick the frame format from whoever reads the frames: an explicit
+        output_format wins, FFmpeg stitching gets JPEG (a fraction of the bytes
+        per frame), compositing / raw quality keeps EXR, everything else PNG.
+        """
+        requested = str(spec.get("output_format", "")).upper()
+        if requested in RENDER_FORMAT_EXTENSIONS:
+            return requested
+        consumer = spec.get("consumer")
+        if consumer == "ffmpeg_stitch":
+            return 'JPEG'
+        if consumer == "compositor" or spec.get("quality") == "raw":
+            return 'OPEN_EXR'
+        return 'PNG'
+
+    def _run_blender_script(self, script_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a static script from blender_scripts/ with params passed after "--"
+        as inline JSON (a JSON sidecar only past INLINE_PARAMS_LIMIT): no per-call
+        source generation and usually no temp file. The scripts build their
+        scene from scratch, so --factory-startup skips loading the user's
+        startup file, preferences and addons.
+        """
+        with _params_arg(params) as params_arg:
+            return self._run_blender_cmd([
+                str(self.blender_path),
+                "-b",  # Headless
+                "--factory-startup",
+                "-P", str(BLENDER_SCRIPTS_DIR / script_name),
+                "--", params_arg
+            ])
 
-for asset_path in assets:
-    if asset_path.endswith('.stl'):
+    def _run_scene_op(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run an ops.py operation in the daemon, falling back to a one-shot Blender."""
         try:
-            bpy.ops.wm.stl_import(filepath=asset_path)
-        except:
-            bpy.ops.import_mesh.stl(filepath=asset_path)
-    elif asset_path.endswith('.obj'):
-        bpy.ops.wm.obj_import(filepath=asset_path)
-
-# Find meshes
-for obj in bpy.context.scene.objects:
-    if obj.type == 'MESH':
-        imported_objects.append(obj)
-
-if not imported_objects:
-    print("ERROR: No geometry imported!")
-    exit()
-
-# 3. AUTO-CENTERING
-primary_obj = imported_objects[0]
-bpy.context.view_layer.objects.active = primary_obj
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-primary_obj.location = (0, 0, 0)
-bpy.ops.object.shade_smooth()
-
-# Apply Material
-mat = bpy.data.materials.new(name="AutoMetal")
-mat.use_nodes = True
-nodes = mat.node_tree.nodes
-bsdf = nodes.get("Principled BSDF")
-if bsdf:
-    bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.9, 1)
-    bsdf.inputs['Metallic'].default_value = 1.0
-    bsdf.inputs['Roughness'].default_value = 0.2
-primary_obj.data.materials.append(mat)
-
-# 4. CAMERA
-dim = primary_obj.dimensions
-max_dim = max(dim.x, dim.y, dim.z)
-cam_dist = max_dim * 2.0
-if cam_dist < 10: cam_dist = 15
-
-cam_data = bpy.data.cameras.new(name='Camera')
-cam_obj = bpy.data.objects.new(name='Camera', object_data=cam_data)
-bpy.context.collection.objects.link(cam_obj)
-bpy.context.scene.camera = cam_obj
-cam_obj.location = (cam_dist, -cam_dist, cam_dist * 0.8)
-
-direction = mathutils.Vector((0,0,0)) - cam_obj.location
-rot_quat = direction.to_track_quat('-Z', 'Y')
-cam_obj.rotation_euler = rot_quat.to_euler()
-
-# 5. LIGHTING (High Quality)
-world = bpy.context.scene.world
-if not world:
-    world = bpy.data.worlds.new("World")
-    bpy.context.scene.world = world
-world.use_nodes = True
-bg = world.node_tree.nodes['Background']
-bg.inputs[0].default_value = (0.2, 0.2, 0.2, 1)
-
-light_data = bpy.data.lights.new(name="KeySun", type='SUN')
-light_data.energy = 5.0
-light_obj = bpy.data.objects.new(name="KeySun", object_data=light_data)
-bpy.context.collection.objects.link(light_obj)
-light_obj.rotation_euler = (0.5, 0.2, 0.5)
-
-bpy.ops.object.light_add(type='AREA', location=(-cam_dist, -cam_dist, cam_dist/2))
-fill_light = bpy.context.object
-fill_light.data.energy = 3000
-fill_light.data.size = max_dim * 2
-
-bpy.ops.object.light_add(type='POINT', location=(0, cam_dist, cam_dist))
-rim_light = bpy.context.object
-rim_light.data.energy = 2000
-rim_light.data.color = (0.8, 0.9, 1.0)
-
-# 6. RENDER SETTINGS (With Unique Filename)
-scene = bpy.context.scene
-output_dir = r'{output_dir}'
-os.makedirs(output_dir, exist_ok=True)
-
-try:
-    scene.render.engine = '{engine_type}'
-except:
-    scene.render.engine = 'BLENDER_EEVEE'
-
-scene.render.resolution_x = 1080
-scene.render.resolution_y = 1080
-scene.render.image_settings.file_format = '{file_format}'
-
-# --- FILENAME FIX ---
-# Use the unique ID we generated in Python
-filename = '{unique_id}_render.png'
-scene.render.filepath = os.path.join(output_dir, filename)
-# --------------------
-
-print(f"Rendering to {{scene.render.filepath}}...")
-bpy.ops.render.render(animation=False, write_still=True)
-"""
-        return script
-    
-    def _generate_scene_creation_script(self, description: str, assets: List[str], style: str) -> str:
-        script = f"""
-import bpy
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-description = '''{description}'''
-assets = {json.dumps(assets)}
-print(f"Scene created for {{description}}")
-"""
-        return script
-
-    def _execute_blender(self, script: str, spec: Dict) -> Dict[str, Any]:
-        """Execute Blender with Python script"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            script_path = f.name
-        
+            rc = self._daemon.request(params)
+        except TimeoutError as e:
+            # A hung operation would hang a one-shot rerun too; let the retry policy decide
+            self.logger.error(f"Blender daemon timed out on {params['op']}: {e}")
+            return {"status": "failed", "error": str(e), "transient": True}
+        if rc is None:
+            self.logger.warning("Blender daemon unavailable; running %s one-shot", params["op"])
+            return self._run_blender_script("ops.py", params)
+        if rc == 0:
+            return {"status": "success", "stdout": "Process finished"}
+        return {"status": "failed", "error": "Blender execution failed"}
+
+    def _run_blender_cmd(self, cmd: List[str]) -> Dict[str, Any]:
+        return asyncio.run(self._run_blender_cmd_async(cmd))
+
+    async def _run_blender_cmd_async(self, cmd: List[str]) -> Dict[str, Any]:
         try:
-            cmd = [
-                str(self.blender_path),
-                "-b",  # Headless
-                "-P", script_path
-            ]
-            
             self.logger.info(f"Executing Blender...")
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                **_SPAWN_KWARGS
             )
             
             if process.stdout is None:
                 raise RuntimeError("Failed to create stdout pipe")
 
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    print(f"Blender: {output.strip()}")
-            
+            # Pass output through in 64 KiB chunks: one read and one write per
+            # chunk instead of a decode + print per line during long renders.
+            # Above INFO the pipe is still drained but nothing is echoed.
+            # Only the last ERROR_TAIL_LINES lines are kept, for the failure report.
+            echo = self.logger.isEnabledFor(logging.INFO)
+            sys.stdout.flush()
+            sink = getattr(sys.stdout, "buffer", None)
+            tail: deque = deque(maxlen=ERROR_TAIL_LINES)
+            partial = b""
+
+            async def pump() -> None:
+                nonlocal partial
+                while True:
+                    chunk = await process.stdout.read(65536)
+                    if not chunk:
+                        break
+                    lines = (partial + chunk).split(b"\n")
+                    partial = lines.pop()[-65536:]
+                    tail.extend(lines)
+                    if not echo:
+                        continue
+                    if sink is not None:
+                        sink.write(chunk)
+                        sink.flush()
+                    else:
+                        sys.stdout.write(chunk.decode("utf-8", errors="replace"))
+                await process.wait()
+
+            try:
+                await asyncio.wait_for(pump(), timeout=BLENDER_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return {"status": "failed", "error": f"Blender timed out after {BLENDER_TIMEOUT}s",
+                        "error_tail": self._format_tail(tail, partial), "transient": True}
+
             if process.returncode == 0:
                 return {"status": "success", "stdout": "Process finished"}
-            else:
-                return {"status": "failed", "error": "Blender execution failed"}
-        
+            if _is_crash(process.returncode):
+                return {"status": "failed", "error": f"Blender crashed (exit code {process.returncode})",
+                        "error_tail": self._format_tail(tail, partial), "transient": True}
+            return {"status": "failed", "error": "Blender execution failed",
+                    "error_tail": self._format_tail(tail, partial)}
+
+        except FileNotFoundError as e:
+            self.logger.error(f"Execution failed: {e}")
+            return {"status": "failed", "error": str(e)}
+        except OSError as e:
+            # Spawn failures (EAGAIN, ENOMEM, EMFILE) usually clear on a retry
+            self.logger.error(f"Execution failed: {e}")
+            return {"status": "failed", "error": str(e), "transient": True}
         except Exception as e:
             self.logger.error(f"Execution failed: {e}")
             return {"status": "failed", "error": str(e)}
-            
-        finally:
-            Path(script_path).unlink(missing_ok=True)
-    
-    def _execute_script(self, script: str) -> Dict[str, Any]:
-        """Execute simple script wrapper"""
-        return self._execute_blender(script, {})
 
+    @staticmethod
+    def _format_tail(tail: deque, partial: bytes) -> str:
+        lines = list(tail) + ([partial] if partial else [])
+        return "\n".join(line.decode("utf-8", errors="replace").rstrip("\r") for line in lines)
 
 def create_blender_engine(blender_path: Optional[str] = None) -> BlenderEngine:
     """Factory function"""
@@ -0,0 +1,99 @@
+"""
+VrindaAI - Blender scene operations (runs inside Blender).
+Invoked as: blender -b -P ops.py -- <params JSON | params.json>
+params["op"] selects the handler; the remaining keys are its arguments.
+stdin_driver.py imports HANDLERS to serve the same operations from a daemon,
+resetting to the same factory scene before each one.
+"""
+
+import bpy
+import json
+import sys
+
+
+def _target(params):
+    """The object an operation edits; a missing one fails the request instead of passing silently."""
+    obj = bpy.data.objects.get(params["object_name"])
+    if not obj:
+        print(f"ERROR: Object not found: {params['object_name']}")
+        sys.exit(1)
+    return obj
+
+
+def create_scene(params):
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete(use_global=False)
+    print(f"Scene created for {params['description']}")
+
+
+def apply_material(params):
+    obj = _target(params)
+    mat = bpy.data.materials.new(name=f"{params['object_name']}_material")
+    mat.use_nodes = True
+    bsdf = mat.node_tree.nodes["Principled BSDF"]
+    bsdf.inputs['Base Color'].default_value = tuple(params["color"])
+    bsdf.inputs['Metallic'].default_value = params["metallic"]
+    bsdf.inputs['Roughness'].default_value = params["roughness"]
+    obj.data.materials.append(mat)
+    print(f"Material applied to {obj.name}")
+
+
+def add_animation(params):
+    obj = _target(params)
+    obj.animation_data_clear()
+    data_path = params.get("data_path")
+    if data_path:
+        setattr(obj, data_path, tuple(params["start_value"]))
+        obj.keyframe_insert(data_path=data_path, frame=params["start_frame"])
+        setattr(obj, data_path, tuple(params["end_value"]))
+        obj.keyframe_insert(data_path=data_path, frame=params["end_frame"])
+    print(f'Animation added to {obj.name}')
+
+
+def setup_camera(params):
+    camera = None
+    for obj in bpy.data.objects:
+        if obj.type == 'CAMERA':
+            camera = obj
+            break
+    if not camera:
+        bpy.ops.object.camera_add()
+        camera = bpy.context.active_object
+    camera.location = tuple(params["position"])
+    camera.rotation_euler = tuple(params["rotation"])
+    camera.data.lens = params["fov"]
+    bpy.context.scene.camera = camera
+    print("Camera setup complete")
+
+
+def setup_lighting(params):
+    # Clear existing lights
+    for obj in bpy.data.objects:
+        if obj.type == 'LIGHT':
+            bpy.data.objects.remove(obj, do_unlink=True)
+    for light_name, config in params["lights"].items():
+        bpy.ops.object.light_add(
+            type=config.get('type', 'SUN'),
+            location=config.get('position', [0,0,5])
+        )
+        light = bpy.context.active_object
+        light.data.energy = config.get('energy', 1000)
+        print(f"Light added: {light_name}")
+
+
+HANDLERS = {
+    "create_scene": create_scene,
+    "apply_material": apply_material,
+    "add_animation": add_animation,
+    "setup_camera": setup_camera,
+    "setup_lighting": setup_lighting,
+}
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:]
+    if argv[0].startswith("{"):
+        params = json.loads(argv[0])
+    else:
+        with open(argv[0], "r", encoding="utf-8") as f:
+            params = json.load(f)
+    HANDLERS[params["op"]](params)
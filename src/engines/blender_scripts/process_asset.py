@@ -0,0 +1,233 @@
+"""
+VrindaAI - Asset processing script (runs inside Blender).
+Invoked as: blender -b -P process_asset.py -- <params JSON | params.json>
+Imports a raw mesh, centers it, rigs it with Rigify and exports an FBX for
+Unreal, optionally followed by a thumbnail render. Paths and limits come from BlenderEngine.process_asset as JSON, so
+no user value is ever spliced into Python source.
+"""
+
+import addon_utils
+import bpy
+import json
+import os
+import sys
+import numpy as np
+
+argv = sys.argv[sys.argv.index("--") + 1:]
+if argv[0].startswith("{"):
+    params = json.loads(argv[0])
+else:
+    with open(argv[0], "r", encoding="utf-8") as f:
+        params = json.load(f)
+
+# 1. Clear Default Scene (read_homefile keeps the loaded preferences and addons;
+# read_factory_settings would unload them and force Rigify to register again)
+bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
+
+# 2. Import Asset
+input_file = params["input_path"]
+ext = os.path.splitext(input_file)[1].lower()
+
+try:
+    if ext == ".obj":
+        bpy.ops.wm.obj_import(filepath=input_file)
+    elif ext == ".fbx":
+        bpy.ops.import_scene.fbx(filepath=input_file)
+    elif ext in [".glb", ".gltf"]:
+        bpy.ops.import_scene.gltf(filepath=input_file)
+    else:
+        print(f"ERROR: Unsupported format {ext}")
+        exit(1)
+except Exception as e:
+    print(f"ERROR: Import failed: {e}")
+    exit(1)
+
+# Select the imported mesh
+mesh_obj = None
+for obj in bpy.context.selected_objects:
+    if obj.type == 'MESH':
+        mesh_obj = obj
+        break
+
+if not mesh_obj:
+    print("ERROR: No mesh found in imported file")
+    exit(1)
+
+# 3. Auto-Rigging (Rigify Integration)
+# Enable Rigify via addon_utils rather than the preferences operator, which marks
+# userprefs dirty. persistent=True keeps it registered across file loads in this
+# Blender process; nothing is written to disk (--factory-startup never saves prefs).
+if not addon_utils.check("rigify")[1]:
+    addon_utils.enable("rigify", default_set=True, persistent=True)
+
+# Deselect all, select mesh
+bpy.ops.object.select_all(action='DESELECT')
+mesh_obj.select_set(True)
+bpy.context.view_layer.objects.active = mesh_obj
+
+# Center mesh: shift vertices so their median sits on the object origin, in
+# one contiguous buffer pass rather than the per-vertex origin_set operator
+me = mesh_obj.data
+co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+me.vertices.foreach_get("co", co)
+co = co.reshape(-1, 3)
+co -= co.mean(axis=0)
+me.vertices.foreach_set("co", co.ravel())
+me.update()
+mesh_obj.location = (0,0,0)
+
+# Add Rig
+if params["rig_type"] == "basic_quadruped":
+    bpy.ops.object.armature_basic_quadruped_add()
+else:
+    bpy.ops.object.armature_human_metarig_add()
+
+metarig = bpy.context.object
+metarig.name = "Root"
+
+# Naive Scaling: Scale rig to match mesh height approximately
+# (A real production script would allow manual bone placement or use ML for keypoint detection)
+dim_z = mesh_obj.dimensions.z
+# Assuming standard metarig is ~2m tall. Scale accordingly.
+scale_factor = dim_z / 1.8 
+metarig.scale = (scale_factor, scale_factor, scale_factor)
+bpy.ops.object.transform_apply(scale=True)
+
+# Parent Mesh to Rig with Automatic Weights
+bpy.ops.object.select_all(action='DESELECT')
+mesh_obj.select_set(True)
+metarig.select_set(True)
+bpy.context.view_layer.objects.active = metarig
+
+def _segment_weights_np(co, heads, tails, chunk=32768):
+    # Inverse squared distance from every vertex to every bone segment, (V, B)
+    seg = tails - heads
+    seg_len2 = np.maximum((seg * seg).sum(axis=1), 1e-12)
+    out = np.empty((len(co), len(heads)), dtype=np.float32)
+    for start in range(0, len(co), chunk):
+        p = co[start:start + chunk, None, :] - heads[None, :, :]
+        t = np.clip((p * seg[None]).sum(axis=2) / seg_len2, 0.0, 1.0)
+        d = p - t[:, :, None] * seg[None]
+        out[start:start + chunk] = 1.0 / np.maximum((d * d).sum(axis=2), 1e-8)
+    return out
+
+try:
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _segment_weights(co, heads, tails):
+        n, b = co.shape[0], heads.shape[0]
+        out = np.empty((n, b), dtype=np.float32)
+        for i in numba.prange(n):
+            for j in range(b):
+                sx = tails[j, 0] - heads[j, 0]
+                sy = tails[j, 1] - heads[j, 1]
+                sz = tails[j, 2] - heads[j, 2]
+                px = co[i, 0] - heads[j, 0]
+                py = co[i, 1] - heads[j, 1]
+                pz = co[i, 2] - heads[j, 2]
+                t = (px * sx + py * sy + pz * sz) / max(sx * sx + sy * sy + sz * sz, 1e-12)
+                t = min(max(t, 0.0), 1.0)
+                dx = px - t * sx
+                dy = py - t * sy
+                dz = pz - t * sz
+                out[i, j] = 1.0 / max(dx * dx + dy * dy + dz * dz, 1e-8)
+        return out
+except ImportError:
+    _segment_weights = _segment_weights_np
+
+def assign_distance_weights(mesh_obj, rig, top_k=4, steps=64):
+    # Vectorized stand-in for heat weighting: each vertex keeps its top_k nearest
+    # deform bones, normalised and quantised so vertex groups fill with one
+    # vg.add() call per (bone, weight level) rather than one per vertex
+    me = mesh_obj.data
+    n = len(me.vertices)
+    co = np.empty(n * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    mw = np.array(mesh_obj.matrix_world, dtype=np.float32)
+    co = co.reshape(-1, 3) @ mw[:3, :3].T + mw[:3, 3]
+
+    bones = [b for b in rig.data.bones if b.use_deform] or list(rig.data.bones)
+    rw = np.array(rig.matrix_world, dtype=np.float32)
+    heads = np.array([b.head_local for b in bones], dtype=np.float32) @ rw[:3, :3].T + rw[:3, 3]
+    tails = np.array([b.tail_local for b in bones], dtype=np.float32) @ rw[:3, :3].T + rw[:3, 3]
+
+    weights = _segment_weights(np.ascontiguousarray(co), heads, tails)
+    k = min(top_k, len(bones))
+    nearest = np.argpartition(-weights, k - 1, axis=1)[:, :k]
+    top = np.take_along_axis(weights, nearest, axis=1)
+    levels = np.rint(top / top.sum(axis=1, keepdims=True) * steps).astype(np.int32)
+
+    for j, bone in enumerate(bones):
+        rows, cols = np.nonzero(nearest == j)
+        if not len(rows):
+            continue
+        vg = mesh_obj.vertex_groups.get(bone.name) or mesh_obj.vertex_groups.new(name=bone.name)
+        bone_levels = levels[rows, cols]
+        for level in np.unique(bone_levels):
+            if level > 0:
+                vg.add(rows[bone_levels == level].tolist(), float(level) / steps, 'REPLACE')
+
+def parent_with_distance_weights():
+    # ARMATURE_NAME adds the armature modifier and empty per-bone groups
+    bpy.ops.object.parent_set(type='ARMATURE_NAME')
+    assign_distance_weights(mesh_obj, metarig)
+    print("Rigging applied with distance weights.")
+
+if len(mesh_obj.data.vertices) > params["auto_weight_vertex_limit"]:
+    # Heat diffusion scales with verts x bones and often fails on dense scans
+    parent_with_distance_weights()
+else:
+    try:
+        bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+        print("Rigging applied with automatic weights.")
+    except Exception as e:
+        print(f"WARNING: Auto-weighting failed: {e}")
+        parent_with_distance_weights()
+
+# 4. Export for Unreal (FBX)
+out_file = params["output_path"]
+bpy.ops.export_scene.fbx(
+    filepath=out_file,
+    use_selection=True,
+    global_scale=1.0,
+    apply_unit_scale=True,
+    bake_anim=False,
+    object_types={'ARMATURE', 'MESH'},
+    mesh_smooth_type='FACE',
+    add_leaf_bones=False, # Critical for Unreal Engine compatibility
+    primary_bone_axis='Y', 
+    secondary_bone_axis='X',
+    # Unreal rebuilds tangents on import and ignores custom props
+    use_tspace=False,
+    use_custom_props=False,
+    use_mesh_modifiers=True,
+    path_mode='STRIP'
+)
+print("SUCCESS: Export complete")
+
+# 5. Optional thumbnail, rendered in this session instead of a second Blender launch
+preview_path = params.get("preview_path")
+if preview_path:
+    import mathutils
+
+    scene = bpy.context.scene
+    dim = mesh_obj.dimensions
+    cam_dist = max(dim.x, dim.y, dim.z, 0.1) * 1.5
+    cam_data = bpy.data.cameras.new(name='PreviewCamera')
+    cam_obj = bpy.data.objects.new(name='PreviewCamera', object_data=cam_data)
+    scene.collection.objects.link(cam_obj)
+    cam_obj.location = (cam_dist, -cam_dist, cam_dist * 0.8)
+    direction = mathutils.Vector((0, 0, 0)) - cam_obj.location
+    cam_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+    scene.camera = cam_obj
+
+    # Workbench rasterizes solid shading with no lights or materials to compile
+    scene.render.engine = 'BLENDER_WORKBENCH'
+    scene.render.resolution_x = params["preview_size"]
+    scene.render.resolution_y = params["preview_size"]
+    scene.render.resolution_percentage = 100
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.filepath = preview_path
+    bpy.ops.render.render(write_still=True)
+    print(f"Preview written to {preview_path}")
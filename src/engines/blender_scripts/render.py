@@ -0,0 +1,188 @@
+"""
+VrindaAI - Blender render script (runs inside Blender).
+Invoked as: blender -b -P render.py -- <params JSON | params.json>
+      or:    blender -b -P render.py -s <first> -e <last> -a -- <params JSON | params.json>
+             for a turntable sequence (params["animation"]); Blender renders the
+             frames after this script has built the scene.
+All values are precomputed by BlenderEngine.render_from_spec; this file only
+applies them, so Blender compiles it once and caches the bytecode.
+"""
+
+import bpy
+import json
+import os
+import sys
+import mathutils
+
+argv = sys.argv[sys.argv.index("--") + 1:]
+if argv[0].startswith("{"):
+    params = json.loads(argv[0])
+else:
+    with open(argv[0], "r", encoding="utf-8") as f:
+        params = json.load(f)
+
+# 1. CLEAN SCENE
+bpy.ops.wm.read_factory_settings(use_empty=True)
+
+# 2. IMPORT ASSETS
+assets = params["assets"]
+imported_objects = []
+
+for asset_path in assets:
+    if asset_path.endswith('.stl'):
+        try:
+            bpy.ops.wm.stl_import(filepath=asset_path)
+        except:
+            bpy.ops.import_mesh.stl(filepath=asset_path)
+    elif asset_path.endswith('.obj'):
+        bpy.ops.wm.obj_import(filepath=asset_path)
+
+# Find meshes
+for obj in bpy.context.scene.objects:
+    if obj.type == 'MESH':
+        imported_objects.append(obj)
+
+if not imported_objects:
+    print("ERROR: No geometry imported!")
+    exit()
+
+# 3. AUTO-CENTERING
+primary_obj = imported_objects[0]
+bpy.context.view_layer.objects.active = primary_obj
+bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+primary_obj.location = (0, 0, 0)
+bpy.ops.object.shade_smooth()
+
+# Apply Material
+mat = bpy.data.materials.new(name="AutoMetal")
+mat.use_nodes = True
+nodes = mat.node_tree.nodes
+bsdf = nodes.get("Principled BSDF")
+if bsdf:
+    bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.9, 1)
+    bsdf.inputs['Metallic'].default_value = 1.0
+    bsdf.inputs['Roughness'].default_value = 0.2
+primary_obj.data.materials.append(mat)
+
+# 4. CAMERA
+dim = primary_obj.dimensions
+max_dim = max(dim.x, dim.y, dim.z)
+cam_dist = max_dim * 2.0
+if cam_dist < 10: cam_dist = 15
+
+cam_data = bpy.data.cameras.new(name='Camera')
+cam_obj = bpy.data.objects.new(name='Camera', object_data=cam_data)
+bpy.context.collection.objects.link(cam_obj)
+bpy.context.scene.camera = cam_obj
+cam_obj.location = (cam_dist, -cam_dist, cam_dist * 0.8)
+
+direction = mathutils.Vector((0,0,0)) - cam_obj.location
+rot_quat = direction.to_track_quat('-Z', 'Y')
+cam_obj.rotation_euler = rot_quat.to_euler()
+
+# 5. LIGHTING (High Quality)
+world = bpy.context.scene.world
+if not world:
+    world = bpy.data.worlds.new("World")
+    bpy.context.scene.world = world
+world.use_nodes = True
+bg = world.node_tree.nodes['Background']
+bg.inputs[0].default_value = (0.2, 0.2, 0.2, 1)
+
+light_data = bpy.data.lights.new(name="KeySun", type='SUN')
+light_data.energy = 5.0
+light_obj = bpy.data.objects.new(name="KeySun", object_data=light_data)
+bpy.context.collection.objects.link(light_obj)
+light_obj.rotation_euler = (0.5, 0.2, 0.5)
+
+bpy.ops.object.light_add(type='AREA', location=(-cam_dist, -cam_dist, cam_dist/2))
+fill_light = bpy.context.object
+fill_light.data.energy = 3000
+fill_light.data.size = max_dim * 2
+
+bpy.ops.object.light_add(type='POINT', location=(0, cam_dist, cam_dist))
+rim_light = bpy.context.object
+rim_light.data.energy = 2000
+rim_light.data.color = (0.8, 0.9, 1.0)
+
+# 6. RENDER SETTINGS
+scene = bpy.context.scene
+output_dir = params["output_dir"]
+os.makedirs(output_dir, exist_ok=True)
+
+try:
+    scene.render.engine = params["engine"]
+except:
+    scene.render.engine = 'BLENDER_EEVEE'
+
+if scene.render.engine == 'CYCLES':
+    # Use every GPU of the first backend that has one (Cycles splits each frame's
+    # work between them, so the sample count stays as requested); adaptive
+    # sampling stops converged pixels early
+    gpu_count = 0
+    try:
+        cprefs = bpy.context.preferences.addons['cycles'].preferences
+        cprefs.refresh_devices()
+        for device_type in ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI'):
+            gpus = [d for d in cprefs.get_devices_for_type(device_type) if d.type != 'CPU']
+            if gpus:
+                cprefs.compute_device_type = device_type
+                for device in gpus:
+                    device.use = True
+                gpu_count = len(gpus)
+                break
+    except Exception as e:
+        print(f"WARNING: GPU detection failed: {e}")
+    if gpu_count:
+        scene.cycles.device = 'GPU'
+    if params.get("samples"):
+        scene.cycles.samples = params["samples"]
+    scene.cycles.use_adaptive_sampling = True
+    scene.cycles.adaptive_threshold = 0.01
+    print(f"Cycles: {gpu_count} GPU(s), {scene.cycles.samples} samples")
+
+if params.get("static_scene"):
+    scene.render.use_persistent_data = True
+    scene.render.use_compositing = False
+    scene.render.use_sequencer = False
+    if scene.render.engine == 'CYCLES':
+        # Big tiles amortize GPU kernel launches; CPU threads balance better on small
+        # ones. Spatial splits cost BVH build time that persistent data pays once.
+        scene.cycles.use_auto_tile = True
+        scene.cycles.tile_size = 2048 if scene.cycles.device == 'GPU' else 64
+        scene.cycles.debug_use_spatial_splits = True
+
+scene.render.resolution_x = 1080
+scene.render.resolution_y = 1080
+scene.render.image_settings.file_format = params["file_format"]
+if params.get("jpeg_quality"):
+    scene.render.image_settings.quality = params["jpeg_quality"]
+if params.get("color_depth"):
+    scene.render.image_settings.color_depth = params["color_depth"]
+if params.get("exr_codec"):
+    scene.render.image_settings.exr_codec = params["exr_codec"]
+if params.get("png_compression") is not None:
+    scene.render.image_settings.compression = params["png_compression"]
+
+scene.render.filepath = os.path.join(output_dir, params["filename"])
+
+if params.get("animation"):
+    # Turntable: the camera orbits once over the full range. Every shard keys the
+    # same range, so frames line up whichever process renders them.
+    scene.render.fps = params["fps"]
+    scene.frame_start = params["frame_start"]
+    scene.frame_end = params["frame_end"]
+    pivot = bpy.data.objects.new("TurntablePivot", None)
+    bpy.context.collection.objects.link(pivot)
+    cam_obj.parent = pivot
+    pivot.rotation_euler = (0, 0, 0)
+    pivot.keyframe_insert(data_path="rotation_euler", frame=params["frame_start"])
+    pivot.rotation_euler = (0, 0, 6.283185307179586)
+    pivot.keyframe_insert(data_path="rotation_euler", frame=params["frame_end"] + 1)
+    for fcurve in pivot.animation_data.action.fcurves:
+        for point in fcurve.keyframe_points:
+            point.interpolation = 'LINEAR'
+    print(f"Scene ready for frames {params['frame_start']}-{params['frame_end']}")
+else:
+    print(f"Rendering to {scene.render.filepath}...")
+    bpy.ops.render.render(animation=False, write_still=True)
@@ -0,0 +1,39 @@
+"""
+VrindaAI - Blender daemon driver (runs inside Blender).
+Invoked as: blender -b -P stdin_driver.py
+Reads one JSON request per stdin line, {"op": <ops.py handler>, ...}, and
+answers each with a "__VRINDA_DONE__<exit code>" line on stdout, preceded by a
+newline so it always starts a line. EOF on stdin ends the loop.
+Every request starts from the factory startup scene, exactly what a one-shot
+"blender -b --factory-startup -P ops.py" sees, so no state leaks between
+requests or workflows and the engine's one-shot fallback behaves the same.
+"""
+
+import bpy
+import json
+import os
+import sys
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import ops
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    if not line.strip():
+        continue
+    rc = 0
+    try:
+        request = json.loads(line)
+        bpy.ops.wm.read_homefile(use_factory_startup=True)
+        ops.HANDLERS[request["op"]](request)
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        rc = 1
+    # Leading newline: the marker must start a line even after unterminated output
+    sys.stdout.write(f"\n__VRINDA_DONE__{rc}\n")
+    sys.stdout.flush()
@@ -3,14 +3,35 @@ VrindaAI - FFmpeg Engine Wrapper
 Replaces DaVinci Resolve for lightweight, headless video assembly.
 """
 
+import asyncio
+import fnmatch
+import glob
 import subprocess
 import logging
 import os
+import re
+import shutil
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# quality -> (crf, x264 preset); "high" is visually lossless
+_QUALITY_SETTINGS = {
+    "high": ("18", "slow"),
+    "medium": ("23", "medium"),
+    "low": ("28", "fast"),
+}
+
+# Frame number at the end of a file stem, e.g. "render_0001"
+_TRAILING_NUMBER_RE = re.compile(r'(\d+)$')
+
+@lru_cache(maxsize=None)
+def _resolve_ffmpeg() -> Optional[str]:
+    """PATH scan once per process; every FFmpegEngine reuses the result."""
+    return shutil.which("ffmpeg")
+
 class FFmpegEngine:
     """
     Automates video stitching, audio mixing, and format conversion using FFmpeg.
@@ -23,8 +44,7 @@ class FFmpegEngine:
             raise FileNotFoundError("FFmpeg executable not found. Please install FFmpeg and add to PATH.")
 
     def _find_ffmpeg(self) -> Optional[str]:
-        import shutil
-        return shutil.which("ffmpeg")
+        return _resolve_ffmpeg()
 
     def create_video_from_sequence(
         self,
@@ -38,17 +58,95 @@ class FFmpegEngine:
         Stitch an image sequence (EXR/PNG/JPG) into a video file.
         Supports both numbered sequences and wildcard patterns.
         """
+        cmd = self._build_sequence_command(image_sequence_pattern, output_file, framerate, audio_file, quality)
+        if isinstance(cmd, dict):
+            return cmd
+        return self._execute_ffmpeg(cmd)
+
+    def create_videos_from_sequences(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Stitch several independent image sequences concurrently.
+        Each job takes the keyword arguments of create_video_from_sequence;
+        results are returned in job order.
+        """
+        cmds = [
+            self._build_sequence_command(
+                job["image_sequence_pattern"], job["output_file"],
+                job.get("framerate", 24), job.get("audio_file"), job.get("quality", "high"))
+            for job in jobs
+        ]
+        # Leave half the cores to libx264's own frame threading
+        limit = max(1, (os.cpu_count() or 2) // 2)
+        return asyncio.run(self._execute_ffmpeg_batch(cmds, limit))
+
+    async def _execute_ffmpeg_batch(self, cmds: List[Any], limit: int) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(cmd):
+            if isinstance(cmd, dict):
+                return cmd
+            async with semaphore:
+                return await self._execute_ffmpeg_async(cmd)
+
+        return await asyncio.gather(*(run(cmd) for cmd in cmds))
+
+    def _build_sequence_command(
+        self,
+        image_sequence_pattern: str,
+        output_file: str,
+        framerate: int,
+        audio_file: Optional[str],
+        quality: str
+    ):
+        """Return the ffmpeg argv for a sequence stitch, or a failure dict."""
         self.logger.info(f"Stitching sequence: {image_sequence_pattern} -> {output_file}")
         
         # Ensure output directory exists
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
+        sequence = self._resolve_sequence_input(image_sequence_pattern)
+        if isinstance(sequence, dict):
+            return sequence
+        pattern, start_num, frame_count = sequence
+        crf, preset = _QUALITY_SETTINGS.get(quality, _QUALITY_SETTINGS["low"])
+
+        cmd = [
+            self.ffmpeg_path,
+            "-y",  # Overwrite output
+            "-framerate", str(framerate),
+            "-start_number", str(start_num),
+            "-i", pattern
+        ]
+
+        if audio_file and os.path.exists(audio_file):
+            cmd.extend(["-i", audio_file, "-c:a", "aac", "-shortest"])
+
+        # Video encoding settings
+        cmd.extend([
+            "-c:v", "libx264",
+            "-preset", preset,
+            "-crf", crf,
+            "-pix_fmt", "yuv420p"
+        ])
+        if frame_count:
+            cmd.extend(["-frames:v", str(frame_count)])
+        cmd.append(output_file)
+
+        return cmd
+
+    def _resolve_sequence_input(self, image_sequence_pattern: str):
+        """
+        Map a frame pattern onto ffmpeg's image2 input: (pattern, start number,
+        frame count or None), or a failure dict when a wildcard matches nothing.
+        """
+        frame_count = None
+
         # Handle wildcard patterns (convert to FFmpeg format)
         if "*" in image_sequence_pattern:
             # Convert wildcard to FFmpeg %d format
-            import glob
-            matches = sorted(glob.glob(image_sequence_pattern))
+            matches = self._enumerate_frames(image_sequence_pattern)
             if matches:
+                frame_count = len(matches)
                 # Infer the pattern from matched files
                 first_file = Path(matches[0])
                 parent = first_file.parent
@@ -56,8 +154,7 @@ class FFmpegEngine:
                 ext = first_file.suffix
                 
                 # Try to find the numeric pattern
-                import re
-                match = re.search(r'(\d+)$', stem)
+                match = _TRAILING_NUMBER_RE.search(stem)
                 if match:
                     num_width = len(match.group(1))
                     base_stem = stem[:match.start()]
@@ -72,39 +169,32 @@ class FFmpegEngine:
         else:
             pattern = image_sequence_pattern.replace("\\", "/")
             start_num = 1
+        return pattern, start_num, frame_count
 
-        # Quality settings
-        if quality == "high":
-            crf = "18"  # Visually lossless
-            preset = "slow"
-        elif quality == "medium":
-            crf = "23"
-            preset = "medium"
-        else:  # low
-            crf = "28"
-            preset = "fast"
-
-        cmd = [
-            self.ffmpeg_path,
-            "-y",  # Overwrite output
-            "-framerate", str(framerate),
-            "-start_number", str(start_num),
-            "-i", pattern
-        ]
-
-        if audio_file and os.path.exists(audio_file):
-            cmd.extend(["-i", audio_file, "-c:a", "aac", "-shortest"])
-
-        # Video encoding settings
-        cmd.extend([
-            "-c:v", "libx264",
-            "-preset", preset,
-            "-crf", crf,
-            "-pix_fmt", "yuv420p",
-            output_file
-        ])
-
-        return self._execute_ffmpeg(cmd)
+    @staticmethod
+    def _enumerate_frames(pattern: str) -> List[str]:
+        """
+        List the files matching a wildcard frame pattern, sorted.
+        A single scandir pass over the frame directory: the entry names come
+        back from one getdents stream and nothing is stat'ed per frame.
+        Matches the same names glob would: case-insensitive on Windows
+        (fnmatch normcases) and dotfiles only for a pattern starting with ".".
+        """
+        directory, name_pattern = os.path.split(pattern)
+        if glob.has_magic(directory):
+            return sorted(glob.glob(pattern))
+        directory = directory or "."
+        hidden = name_pattern.startswith(".")
+        try:
+            with os.scandir(directory) as entries:
+                names = [
+                    entry.name for entry in entries
+                    if (hidden or not entry.name.startswith(".")) and fnmatch.fnmatch(entry.name, name_pattern)
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        names.sort()
+        return [os.path.join(directory, name) for name in names]
 
     def concat_clips(
         self,
@@ -142,6 +232,56 @@ class FFmpegEngine:
             
         return result
 
+    def stitch_and_concat(
+        self,
+        image_sequence_pattern: str,
+        clip_paths: List[str],
+        output_file: str,
+        framerate: int = 24,
+        quality: str = "high",
+        resolution: str = "1920x1080"
+    ) -> Dict[str, Any]:
+        """
+        Stitch an image sequence and append existing clips in one ffmpeg run.
+        Every input is normalized to framerate/resolution inside a single
+        filter_complex and concatenated, instead of encoding the sequence to an
+        intermediate file and launching a second ffmpeg to join it.
+        """
+        self.logger.info(f"Stitching {image_sequence_pattern} + {len(clip_paths)} clips -> {output_file}")
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+
+        sequence = self._resolve_sequence_input(image_sequence_pattern)
+        if isinstance(sequence, dict):
+            return sequence
+        pattern, start_num, frame_count = sequence
+        crf, preset = _QUALITY_SETTINGS.get(quality, _QUALITY_SETTINGS["low"])
+        width, height = resolution.lower().split("x")
+
+        cmd = [self.ffmpeg_path, "-y", "-framerate", str(framerate), "-start_number", str(start_num), "-i", pattern]
+        for clip in clip_paths:
+            cmd.extend(["-i", clip])
+
+        inputs = len(clip_paths) + 1
+        normalize = (
+            f"fps={framerate},scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,format=yuv420p"
+        )
+        # Wildcard sequences stop at the frames that actually matched
+        trim = f"trim=end_frame={frame_count}," if frame_count else ""
+        graph = ";".join(f"[{i}:v]{trim if i == 0 else ''}{normalize}[v{i}]" for i in range(inputs))
+        graph += ";" + "".join(f"[v{i}]" for i in range(inputs)) + f"concat=n={inputs}:v=1:a=0[out]"
+
+        cmd.extend([
+            "-filter_complex", graph,
+            "-map", "[out]",
+            "-c:v", "libx264",
+            "-preset", preset,
+            "-crf", crf,
+            "-pix_fmt", "yuv420p",
+            output_file
+        ])
+        return self._execute_ffmpeg(cmd)
+
     def apply_background_music(self, video_file: str, music_file: str, output_file: str) -> Dict[str, Any]:
         """Mix background music into a video."""
         cmd = [
@@ -176,6 +316,25 @@ class FFmpegEngine:
         except Exception as e:
             return {"status": "failed", "error": str(e)}
 
+    async def _execute_ffmpeg_async(self, cmd: List[str]) -> Dict[str, Any]:
+        try:
+            self.logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await proc.communicate()
+
+            if proc.returncode == 0:
+                return {"status": "success", "output": stdout.decode(errors="replace")}
+            else:
+                error = stderr.decode(errors="replace")
+                self.logger.error(f"FFmpeg Error: {error}")
+                return {"status": "failed", "error": error}
+        except Exception as e:
+            return {"status": "failed", "error": str(e)}
+
 def create_ffmpeg_engine() -> FFmpegEngine:
     return FFmpegEngine()
 
@@ -227,6 +386,32 @@ if __name__ == "__main__":
             else:
                  result = engine.create_video_from_sequence(pattern, output_file, framerate, audio_file, quality)
 
+        elif command == "create_videos_from_sequences":
+            jobs = job_args.get("jobs", [])
+
+            if not jobs or any(not j.get("image_sequence_pattern") or not j.get("output_file") for j in jobs):
+                 logger.error("Manifest 'jobs' must list image_sequence_pattern/output_file pairs.")
+                 result = {"status": "failed", "error": "Missing required arguments in job manifest."}
+            else:
+                 results = engine.create_videos_from_sequences(jobs)
+                 failed = [r for r in results if r["status"] != "success"]
+                 result = {"status": "failed" if failed else "success", "results": results}
+                 if failed:
+                     result["error"] = failed[0].get("error")
+
+        elif command == "stitch_and_concat":
+            pattern = job_args.get("image_sequence_pattern")
+            output_file = job_args.get("output_file")
+
+            if not pattern or not output_file:
+                 logger.error("Manifest missing 'image_sequence_pattern' or 'output_file' for stitch_and_concat.")
+                 result = {"status": "failed", "error": "Missing required arguments in job manifest."}
+            else:
+                 result = engine.stitch_and_concat(
+                     pattern, job_args.get("clip_paths", []), output_file,
+                     job_args.get("framerate", 24), job_args.get("quality", "medium"),
+                     job_args.get("resolution", "1920x1080"))
+
         elif command == "apply_background_music":
             video = job_args.get("video_file")
             music = job_args.get("music_file")
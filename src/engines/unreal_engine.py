@@ -7,6 +7,8 @@ import subprocess
 import json
 import logging
 import os
+import shutil
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
@@ -14,6 +16,28 @@ import tempfile
 
 logger = logging.getLogger(__name__)
 
+COMMON_UNREAL_PATHS = (
+    "C:/Program Files/Epic Games/UE_5.6",
+    "C:/Program Files/Epic Games/UE_5.5",
+    "C:/Program Files/Epic Games/UE_5.4",
+    "C:/Program Files/Epic Games/UE_5.3",
+    "C:/Program Files/Epic Games/UE_5.2",
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve_unreal_root() -> Optional[str]:
+    """Probe for an Unreal install once per process; the result cannot change mid-run."""
+    for path in COMMON_UNREAL_PATHS:
+        if Path(path).exists():
+            return path
+
+    # Fall back to an editor on PATH: <root>/Engine/Binaries/<Platform>/UnrealEditor-Cmd
+    editor = shutil.which("UnrealEditor-Cmd")
+    if editor:
+        return str(Path(editor).resolve().parents[3])
+    return None
+
 class UnrealEngine:
     """
     Unreal Engine 5 automation engine.
@@ -34,17 +58,7 @@ class UnrealEngine:
     
     def _find_unreal(self) -> Optional[str]:
         """Find common Unreal Engine installation paths."""
-        common_paths = [
-            "C:/Program Files/Epic Games/UE_5.6",
-            "C:/Program Files/Epic Games/UE_5.5",
-            "C:/Program Files/Epic Games/UE_5.4",
-            "C:/Program Files/Epic Games/UE_5.3",
-            "C:/Program Files/Epic Games/UE_5.2",
-        ]
-        for path in common_paths:
-            if Path(path).exists():
-                return path
-        return None
+        return _resolve_unreal_root()
 
     def set_active_project(self, project_path: str):
         """Set the active project path for subsequent commands."""
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from src.core.asset_manager import create_asset_manager
+
+
+@pytest.fixture
+def library(tmp_path):
+    library = tmp_path / "lib"
+    (library / "props").mkdir(parents=True)
+    (library / "props" / "SciFi_Crate.fbx").write_text("crate")
+    (library / "Footsteps.wav").write_text("steps")
+    return library
+
+
+@pytest.fixture
+def manager(library):
+    return create_asset_manager({"paths": {"library_path": str(library)}})
+
+
+def test_ingest_assets_batch_resolves_queries_and_paths(manager, tmp_path):
+    direct = tmp_path / "hero.obj"
+    direct.write_text("hero")
+    project = tmp_path / "project"
+
+    results = manager.ingest_assets_batch(["scifi_crate", str(direct), "footsteps"], str(project))
+
+    assert list(results) == ["scifi_crate", str(direct), "footsteps"]
+    assert all(r["status"] == "success" for r in results.values())
+    for name in ("SciFi_Crate.fbx", "hero.obj", "Footsteps.wav"):
+        assert (project / "Raw_Downloads" / name).exists()
+
+    manifest = json.loads((project / "project_assets.json").read_text())
+    assert manifest["last_asset_id"] == 3
+    assert {a["id"] for a in manifest["assets"]} == {r["asset_id"] for r in results.values()}
+
+
+def test_ingest_assets_batch_reports_missing_assets(manager, tmp_path):
+    project = tmp_path / "project"
+
+    results = manager.ingest_assets_batch(["no_such_asset", "scifi_crate"], str(project))
+
+    assert results["no_such_asset"] == {"status": "failed", "error": "Asset not found in local library"}
+    assert results["scifi_crate"]["status"] == "success"
+    manifest = json.loads((project / "project_assets.json").read_text())
+    assert [a["name"] for a in manifest["assets"]] == ["SciFi_Crate"]
+
+
+def test_ingest_assets_batch_writes_no_manifest_when_nothing_matched(manager, tmp_path):
+    project = tmp_path / "project"
+
+    results = manager.ingest_assets_batch(["no_such_asset"], str(project))
+
+    assert results["no_such_asset"]["status"] == "failed"
+    assert not (project / "project_assets.json").exists()
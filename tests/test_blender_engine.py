@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+
+from src.engines import blender_engine
+
+
+def test_params_arg_inline_below_limit():
+    params = {"op": "setup_camera", "fov": 50}
+    with blender_engine._params_arg(params) as arg:
+        assert json.loads(arg) == params
+
+
+def test_params_arg_uses_temp_file_above_limit(monkeypatch):
+    monkeypatch.setattr(blender_engine, "INLINE_PARAMS_LIMIT", 10)
+    params = {"assets": ["a" * 20]}
+    with blender_engine._params_arg(params) as arg:
+        assert not arg.startswith("{")
+        with open(arg, encoding="utf-8") as f:
+            assert json.load(f) == params
+    assert not os.path.exists(arg)
+
+
+@pytest.mark.parametrize("start, end, workers, expected", [
+    (1, 8, 2, [(1, 4), (5, 8)]),
+    (1, 10, 3, [(1, 4), (5, 7), (8, 10)]),
+    (5, 6, 4, [(5, 5), (6, 6)]),
+    (1, 3, 0, [(1, 3)]),
+])
+def test_frame_shards(start, end, workers, expected):
+    assert blender_engine.BlenderEngine._frame_shards(start, end, workers) == expected
+
+
+class _FakeShard:
+    def __init__(self, returncode=0):
+        self.returncode = returncode
+        self.killed = False
+
+    def poll(self):
+        return None if not self.killed and self.returncode is None else self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture
+def engine():
+    engine = blender_engine.BlenderEngine("blender-not-run")
+    yield engine
+    engine.close()
+
+
+def test_render_sequence_empty_range(engine, tmp_path):
+    res = engine.render_sequence({"frame_start": 10, "frame_end": 5}, str(tmp_path))
+    assert res["status"] == "failed"
+    assert "Empty frame range" in res["error"]
+
+
+def test_render_sequence_counts_frames_per_shard(engine, tmp_path, monkeypatch):
+    launched = []
+
+    def render_shard(params_arg, start, end, gpu_id):
+        launched.append((start, end, gpu_id))
+        pattern = json.loads(params_arg)["filename"]
+        for frame in range(start, end + 1):
+            (tmp_path / (pattern.replace("####", f"{frame:04d}") + ".png")).write_text("px")
+        return _FakeShard()
+
+    monkeypatch.setattr(engine, "_render_shard", render_shard)
+    res = engine.render_sequence({"frame_start": 1, "frame_end": 4, "gpu_ids": [0, 1]}, str(tmp_path))
+
+    assert res == {"status": "success", "frame_count": 4, "shards": 2}
+    assert launched == [(1, 2, "0"), (3, 4, "1")]
+
+
+def test_render_sequence_launch_failure_kills_started_shards(engine, tmp_path, monkeypatch):
+    started = []
+
+    def render_shard(params_arg, start, end, gpu_id):
+        if started:
+            raise OSError("Resource temporarily unavailable")
+        started.append(_FakeShard(returncode=None))
+        return started[0]
+
+    monkeypatch.setattr(engine, "_render_shard", render_shard)
+    res = engine.render_sequence({"frame_start": 1, "frame_end": 4, "render_workers": 2}, str(tmp_path))
+
+    assert res["status"] == "failed"
+    assert res["transient"] is True
+    assert started[0].killed
+
+
+def test_render_sequence_reports_failed_shards(engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, "_render_shard",
+                        lambda params_arg, start, end, gpu_id: _FakeShard(returncode=1 if start > 1 else 0))
+    res = engine.render_sequence({"frame_start": 1, "frame_end": 4, "render_workers": 2}, str(tmp_path))
+
+    assert res["status"] == "failed"
+    assert res["error"] == "Blender failed on frames 3-4"
+    assert res["transient"] is False
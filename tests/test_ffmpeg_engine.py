@@ -0,0 +1,31 @@
+import glob
+import os
+
+from src.engines.ffmpeg_engine import FFmpegEngine
+
+
+def _touch(directory, *names):
+    for name in names:
+        (directory / name).write_text("")
+
+
+def test_enumerate_frames_matches_glob(tmp_path):
+    _touch(tmp_path, "f_0002.png", "f_0001.png", "f_0003.jpg", ".f_0004.png", "other.png")
+    pattern = str(tmp_path / "f_*.png")
+
+    frames = FFmpegEngine._enumerate_frames(pattern)
+
+    assert frames == sorted(glob.glob(pattern))
+    assert [os.path.basename(f) for f in frames] == ["f_0001.png", "f_0002.png"]
+
+
+def test_enumerate_frames_keeps_dotfiles_for_dot_patterns(tmp_path):
+    _touch(tmp_path, ".f_0001.png", "f_0002.png")
+
+    frames = FFmpegEngine._enumerate_frames(str(tmp_path / ".f_*.png"))
+
+    assert [os.path.basename(f) for f in frames] == [".f_0001.png"]
+
+
+def test_enumerate_frames_missing_directory(tmp_path):
+    assert FFmpegEngine._enumerate_frames(str(tmp_path / "missing" / "f_*.png")) == []
@@ -0,0 +1,377 @@
+import json
+import os
+
+import pytest
+
+from src.core.orchestrator import create_orchestrator
+
+
+@pytest.fixture
+def orch(tmp_path):
+    orch = create_orchestrator({
+        "output_dir": str(tmp_path / "out"),
+        "retry_delay": 0.0,
+        # No Kernel runs under test; fail the readiness probe fast
+        "kernel_connect_timeout": 0.1,
+        "paths": {
+            "library_path": str(tmp_path / "lib"),
+            "unreal_projects_root": str(tmp_path / "ue"),
+        },
+    })
+    yield orch
+    orch.close()
+
+
+@pytest.fixture
+def fake_render(orch):
+    calls = []
+
+    def dispatch(job, context):
+        out = job["output"]["path"]
+        os.makedirs(out, exist_ok=True)
+        frame = os.path.join(out, "frame_0001.png")
+        with open(frame, "w") as f:
+            f.write("px")
+        calls.append(out)
+        return {"status": "success", "output_path": frame}
+
+    orch._dispatch_job = dispatch
+    return calls
+
+
+def _render(orch):
+    result = orch.execute_workflow({"engine": "blender", "description": "memo test"})
+    assert result["status"] == "completed"
+    return result["job_results"]["blender_render"]
+
+
+def test_memo_hit_rebases_output_paths(orch, fake_render):
+    first = _render(orch)
+    second = _render(orch)
+
+    assert len(fake_render) == 1
+    assert second["cached"] is True
+    assert second["output_path"] != first["output_path"]
+    assert os.path.exists(second["output_path"])
+
+
+def test_memo_misses_when_cached_outputs_are_gone(orch, fake_render):
+    first = _render(orch)
+    os.remove(first["output_path"])
+
+    again = _render(orch)
+
+    assert len(fake_render) == 2
+    assert "cached" not in again
+
+
+def test_malformed_memo_is_a_miss(orch, fake_render):
+    _render(orch)
+    memo_dir = orch.output_dir / ".memo"
+    for memo_file in memo_dir.iterdir():
+        memo = json.loads(memo_file.read_text())
+        memo_file.write_text(json.dumps({"output_path": memo["output_path"]}))
+
+    again = _render(orch)
+
+    assert len(fake_render) == 2
+    assert "cached" not in again
+
+
+def _single_job(orch, dispatch):
+    orch._dispatch_job = dispatch
+    manifests = [{
+        "id": "job",
+        "engine": "unreal",
+        "type": "ingest_batch",
+        "parameters": {},
+        "output": {"path": str(orch.output_dir / "job")},
+    }]
+    return orch._execute_jobs(manifests, orch._index_dependencies(manifests))
+
+
+def test_transient_failure_is_retried(orch):
+    calls = []
+
+    def dispatch(job, context):
+        calls.append(job["id"])
+        if len(calls) == 1:
+            return {"status": "failed", "error": "Blender crashed (exit code -11)", "transient": True}
+        return {"status": "success"}
+
+    result = _single_job(orch, dispatch)
+
+    assert result["overall_status"] == "completed"
+    assert len(calls) == 2
+
+
+def test_permanent_failure_is_not_retried(orch):
+    calls = []
+
+    def dispatch(job, context):
+        calls.append(job["id"])
+        return {"status": "failed", "error": "Blender execution failed"}
+
+    result = _single_job(orch, dispatch)
+
+    assert result["overall_status"] == "failed"
+    assert len(calls) == 1
+
+
+def test_exhausted_retries_report_the_engine_result(orch):
+    orch.config["max_retries"] = 1
+
+    def dispatch(job, context):
+        return {"status": "failed", "error": "Blender timed out after 3600s", "transient": True, "error_tail": "..."}
+
+    result = _single_job(orch, dispatch)
+
+    assert result["overall_status"] == "failed"
+    assert result["job_results"]["job"]["error_tail"] == "..."
+
+
+def test_unreachable_kernel_disables_offload(tmp_path):
+    from src.core import orchestrator
+
+    if orchestrator.vryndara_pb2 is None:
+        pytest.skip("Kernel protos not importable")
+    client = orchestrator.KernelClient("localhost:1", connect_timeout=0.1)
+    try:
+        assert client.enabled is False
+    finally:
+        client.close()
+
+
+def test_design_workflow_runs_locally_without_kernel(orch, fake_render):
+    result = orch.execute_workflow({"engine": "blender", "description": "Design a ring"})
+
+    assert result["status"] == "completed"
+    assert len(fake_render) == 1
+
+
+@pytest.fixture
+def fake_kernel(orch):
+    from concurrent.futures import Future
+
+    def submit(description):
+        future = Future()
+        future.set_result({"proxy_path": "/kernel/proxy.stl"})
+        return future
+
+    orch.kernel.enabled = True
+    orch.kernel.submit_engineering_task_future = submit
+
+
+def test_offload_previews_kernel_proxy(orch, fake_kernel, fake_render):
+    result = orch.execute_workflow({"engine": "blender", "description": "Design a ring"})
+
+    assert result["status"] == "offloaded"
+    assert result["job_results"]["blender_render"]["status"] == "success"
+
+
+def test_offload_failed_preview_fails_workflow(orch, fake_kernel):
+    orch._dispatch_job = lambda job, context: {"status": "failed", "error": "no GPU"}
+
+    result = orch.execute_workflow({"engine": "blender", "description": "Design a ring"})
+
+    assert result["status"] == "failed"
+    assert result["artifacts"] == {"proxy_path": "/kernel/proxy.stl"}
+
+
+def test_offload_skips_blender_preview_for_unreal(orch, fake_kernel, fake_render):
+    result = orch.execute_workflow({"engine": "unreal", "description": "Design a level"})
+
+    assert result["status"] == "offloaded"
+    assert fake_render == []
+    assert "job_results" not in result
+
+
+def _init_project(orch, path, project_type):
+    reply = orch.init_project_content({"name": "Demo", "type": project_type, "prompt": "a ring", "path": str(path)})
+    return json.loads(reply)["message"]
+
+
+def test_init_project_content_skips_unchanged_project(orch, tmp_path):
+    project = tmp_path / "proj"
+    assert "initialized" in _init_project(orch, project, "blender")
+    assert "already up to date" in _init_project(orch, project, "blender")
+
+
+@pytest.mark.parametrize("project_type, generated", [
+    ("blender", "scripts/generate_geometry.py"),
+    ("game", "Demo.uproject"),
+])
+def test_init_project_content_regenerates_deleted_or_edited_files(orch, tmp_path, project_type, generated):
+    project = tmp_path / "proj"
+    _init_project(orch, project, project_type)
+    original = (project / generated).read_text()
+
+    (project / generated).write_text("edited")
+    assert "initialized" in _init_project(orch, project, project_type)
+    assert (project / generated).read_text() == original
+
+    (project / generated).unlink()
+    assert "initialized" in _init_project(orch, project, project_type)
+    assert (project / generated).exists()
+
+
+def _jobs(*specs):
+    return [{"id": job_id, "engine": "x", "type": "y", "depends_on": list(deps)} for job_id, deps in specs]
+
+
+def _recording_dispatch(orch, fail=(), delay=0.0):
+    import threading
+    import time
+
+    order = []
+    lock = threading.Lock()
+
+    def dispatch(job, context):
+        time.sleep(delay)
+        with lock:
+            order.append(job["id"])
+        return {"status": "failed" if job["id"] in fail else "success", "error": f"{job['id']} broke"}
+
+    orch._dispatch_job = dispatch
+    return order
+
+
+def test_sequential_runs_dependencies_first(orch):
+    from src.core.orchestrator import ExecutionMode
+
+    order = _recording_dispatch(orch)
+    manifests = _jobs(("c", ["a", "b"]), ("a", []), ("b", ["a"]))
+
+    res = orch._execute_jobs(manifests, orch._index_dependencies(manifests), ExecutionMode.SEQUENTIAL)
+
+    assert res["overall_status"] == "completed"
+    assert order == ["a", "b", "c"]
+
+
+def test_sequential_stops_at_first_failure(orch):
+    order = _recording_dispatch(orch, fail={"a"})
+    manifests = _jobs(("a", []), ("b", ["a"]))
+
+    res = orch._execute_jobs(manifests, orch._index_dependencies(manifests))
+
+    assert res["overall_status"] == "failed"
+    assert res["error"] == "a broke"
+    assert order == ["a"]
+
+
+def test_parallel_overlaps_independent_jobs(orch):
+    import time
+
+    from src.core.orchestrator import ExecutionMode
+
+    orch.config["max_parallel_jobs"] = 3
+    order = _recording_dispatch(orch, delay=0.2)
+    manifests = _jobs(("a", []), ("b", []), ("c", []), ("d", ["a", "b", "c"]))
+
+    start = time.monotonic()
+    res = orch._execute_jobs(manifests, orch._index_dependencies(manifests), ExecutionMode.PARALLEL)
+
+    assert res["overall_status"] == "completed"
+    assert sorted(order[:3]) == ["a", "b", "c"] and order[3] == "d"
+    # Three 0.2s roots side by side, then d: well under the 0.8s a serial run takes
+    assert time.monotonic() - start < 0.7
+
+
+def test_parallel_failure_skips_dependents(orch):
+    from src.core.orchestrator import ExecutionMode
+
+    order = _recording_dispatch(orch, fail={"bad"})
+    manifests = _jobs(("bad", []), ("ok", []), ("after", ["bad", "ok"]))
+
+    res = orch._execute_jobs(manifests, orch._index_dependencies(manifests), ExecutionMode.PARALLEL)
+
+    assert res["overall_status"] == "failed"
+    assert res["error"] == "bad broke"
+    assert "after" not in order
+    assert "after" not in res["job_results"]
+
+
+def test_index_dependencies_builds_children_and_counts(orch):
+    index = orch._index_dependencies(_jobs(("a", []), ("b", ["a"]), ("c", ["a", "b"])))
+
+    assert index["children"] == [[1, 2], [2], []]
+    assert index["remaining"] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("manifests, message", [
+    (_jobs(("a", ["z"])), "unknown job z"),
+    (_jobs(("a", ["b"]), ("b", ["a"])), "cycle"),
+    (_jobs(("a", []), ("a", [])), "Duplicate job id"),
+])
+def test_index_dependencies_rejects_bad_graphs(orch, manifests, message):
+    with pytest.raises(ValueError, match=message):
+        orch._index_dependencies(manifests)
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("", {0, 1, 2}),
+    ("All", {0, 1, 2}),
+    ("2", {1}),
+    ("1,3-5", {0, 2}),
+    (" 2 - 3 ", {1, 2}),
+    ("1, all", {0, 1, 2}),
+])
+def test_parse_job_selection(answer, expected):
+    from src.core.orchestrator import _parse_job_selection
+
+    assert _parse_job_selection(answer, 3) == expected
+
+
+def test_parse_job_selection_ignores_invalid_tokens():
+    from src.core.orchestrator import _parse_job_selection
+
+    assert _parse_job_selection("x, 2, 0, 9", 3) == {1}
+    assert _parse_job_selection("nope", 3) == set()
+
+
+def test_interactive_mode_skips_deselected_jobs(orch, monkeypatch):
+    from src.core.orchestrator import ExecutionMode
+
+    order = _recording_dispatch(orch)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "2-3")
+    manifests = _jobs(("a", []), ("b", ["a"]), ("c", ["b"]))
+
+    res = orch._execute_jobs(manifests, orch._index_dependencies(manifests), ExecutionMode.INTERACTIVE)
+
+    assert order == ["b", "c"]
+    assert res["job_results"]["a"] == {"status": "skipped"}
+
+
+def test_interactive_mode_without_stdin_runs_nothing(orch, monkeypatch):
+    from src.core.orchestrator import ExecutionMode
+
+    order = _recording_dispatch(orch)
+
+    def no_stdin(prompt=""):
+        raise EOFError
+
+    monkeypatch.setattr("builtins.input", no_stdin)
+    manifests = _jobs(("a", []))
+
+    res = orch._execute_jobs(manifests, orch._index_dependencies(manifests), ExecutionMode.INTERACTIVE)
+
+    assert order == []
+    assert res["job_results"]["a"] == {"status": "skipped"}
+
+
+def _plain_safe_desc(desc):
+    return "".join(c for c in desc if c.isalnum() or c in " -_").strip()[:30]
+
+
+@pytest.mark.parametrize("desc", [
+    "Design a ring: 18k gold, size 7!",
+    "A castle " * 1000,
+    " " * 5000 + "late start " * 10,
+    "!" * 300 + "after punctuation " * 5,
+    "x" * 25 + " " * 2000 + "tail",
+    " " * 3000,
+])
+def test_safe_desc_matches_full_sanitize(desc):
+    from src.core.orchestrator import _safe_desc
+
+    assert _safe_desc(desc) == _plain_safe_desc(desc)